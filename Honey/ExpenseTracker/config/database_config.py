@@ -3,6 +3,8 @@ Database Configuration
 Update these settings according to your MySQL installation
 """
 
+import os
+
 # MySQL Database Configuration
 DB_CONFIG = {
     'host': 'localhost',
@@ -15,8 +17,11 @@ DB_CONFIG = {
 }
 
 # Connection pool settings
+# pool_reset_session=False skips the RESET CONNECTION round-trip on every
+# checkout; we never rely on session state (temp tables, user variables),
+# so the reset was pure overhead on each query.
 POOL_CONFIG = {
     'pool_name': 'expense_pool',
-    'pool_size': 5,
-    'pool_reset_session': True
+    'pool_size': min(32, (os.cpu_count() or 4) * 4),
+    'pool_reset_session': False
 }
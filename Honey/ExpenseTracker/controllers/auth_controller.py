@@ -3,19 +3,47 @@ Authentication Controller
 Handles login, registration, and session management
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import hashlib
+import secrets
+import time
 
 from models.user import User
 from utils.helpers import validate_email, validate_username, validate_password
 
+# Per-process salt for the login cache keys - never persisted, so the
+# cache cannot outlive the process
+_LOGIN_SALT = secrets.token_bytes(16)
+_LOGIN_CACHE_TTL = 300  # seconds
+
+# Just long enough to absorb a double-clicked submit button
+_EXISTS_CACHE_TTL = 1.0  # seconds
+
 
 class AuthController:
     """Authentication controller class"""
-    
+
     _current_user = None
-    
+
+    # Recently verified logins keyed by (username, salted password hash)
+    # so repeat authentications skip the DB round-trip
+    _login_cache = {}
+
+    # Short-lived User.exists results so rapid resubmits of the same
+    # form do not hit the DB twice
+    _exists_cache = {}
+
+    @classmethod
+    def _cached_exists(cls, username=None, email=None):
+        """User.exists with a short memo for repeated lookups"""
+        key = (username, email)
+        cached = cls._exists_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < _EXISTS_CACHE_TTL:
+            return cached[1]
+        result = User.exists(username=username, email=email)
+        cls._exists_cache[key] = (now, result)
+        return result
+
     @classmethod
     def login(cls, username, password):
         """
@@ -24,11 +52,20 @@ class AuthController:
         """
         if not username or not password:
             return False, "Please enter username and password", None
-        
+
+        key = (username,
+               hashlib.sha256(_LOGIN_SALT + password.encode()).hexdigest())
+        cached = cls._login_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _LOGIN_CACHE_TTL:
+            user = cached[1]
+            cls._current_user = user
+            return True, f"Welcome back, {user.full_name}!", user
+
         user = User.authenticate(username, password)
-        
+
         if user:
             cls._current_user = user
+            cls._login_cache[key] = (time.monotonic(), user)
             return True, f"Welcome back, {user.full_name}!", user
         else:
             return False, "Invalid username or password", None
@@ -61,7 +98,7 @@ class AuthController:
             return False, "Passwords do not match", None
         
         # Check if username or email exists
-        exists, field = User.exists(username=username, email=email)
+        exists, field = cls._cached_exists(username=username, email=email)
         if exists:
             if field == 'username':
                 return False, "Username already taken", None
@@ -73,6 +110,8 @@ class AuthController:
         
         if user:
             cls._current_user = user
+            # The name/email now exist - stale negatives must not linger
+            cls._exists_cache.clear()
             return True, "Registration successful! Welcome!", user
         else:
             return False, "Registration failed. Please try again.", None
@@ -81,6 +120,7 @@ class AuthController:
     def logout(cls):
         """Log out current user"""
         cls._current_user = None
+        cls._login_cache.clear()
         return True, "Logged out successfully"
     
     @classmethod
@@ -103,7 +143,7 @@ class AuthController:
             return False, "Please enter a valid email address"
         
         if email and email != cls._current_user.email:
-            exists, _ = User.exists(email=email)
+            exists, _ = cls._cached_exists(email=email)
             if exists:
                 return False, "Email already registered"
         
@@ -114,6 +154,7 @@ class AuthController:
                 cls._current_user.full_name = full_name
             if email:
                 cls._current_user.email = email
+            cls._exists_cache.clear()
             return True, "Profile updated successfully"
         
         return False, "Failed to update profile"
@@ -132,4 +173,7 @@ class AuthController:
             return False, msg
         
         success, message = cls._current_user.change_password(old_password, new_password)
+        if success:
+            # Cached logins hold the old password hash - drop them
+            cls._login_cache.clear()
         return success, message
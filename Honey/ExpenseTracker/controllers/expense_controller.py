@@ -3,18 +3,29 @@ Expense Controller
 Handles expense-related operations
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from models.expense import Expense, Category
 from datetime import datetime, date
 from utils.helpers import format_currency, export_to_csv, generate_report_filename
 
+# Per-user write counter - views compare it to decide whether their
+# cached query results are still valid
+_expense_versions = {}
+
 
 class ExpenseController:
     """Expense controller class"""
-    
+
+    @staticmethod
+    def get_version(user_id):
+        """Get the write-version counter for a user's expenses"""
+        return _expense_versions.get(user_id, 0)
+
+    @staticmethod
+    def bump_version(user_id):
+        """Invalidate cached reads after a write"""
+        _expense_versions[user_id] = _expense_versions.get(user_id, 0) + 1
+
+
     @staticmethod
     def add_expense(user_id, category_id, amount, description, 
                    expense_date, payment_method='Cash', notes=None):
@@ -45,6 +56,7 @@ class ExpenseController:
         )
         
         if expense:
+            ExpenseController.bump_version(user_id)
             return True, "Expense added successfully!", expense
         else:
             return False, "Failed to add expense", None
@@ -71,6 +83,7 @@ class ExpenseController:
         success = expense.update(**kwargs)
         
         if success:
+            ExpenseController.bump_version(user_id)
             return True, "Expense updated successfully!"
         else:
             return False, "Failed to update expense"
@@ -84,13 +97,14 @@ class ExpenseController:
         success = Expense.delete_by_id(expense_id, user_id)
         
         if success:
+            ExpenseController.bump_version(user_id)
             return True, "Expense deleted successfully!"
         else:
             return False, "Failed to delete expense"
     
     @staticmethod
-    def get_expenses(user_id, start_date=None, end_date=None, 
-                    category_id=None, limit=None, offset=0):
+    def get_expenses(user_id, start_date=None, end_date=None,
+                    category_id=None, limit=None, offset=0, after=None):
         """Get user expenses with filters"""
         return Expense.get_user_expenses(
             user_id=user_id,
@@ -98,7 +112,8 @@ class ExpenseController:
             end_date=end_date,
             category_id=category_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
     
     @staticmethod
@@ -125,16 +140,32 @@ class ExpenseController:
         
         # Today's date
         today_date = today.date()
-        
-        # Get statistics
-        monthly_stats = Expense.get_expense_stats(user_id, month_start, month_end)
-        today_total = Expense.get_total_expenses(user_id, today_date, today_date)
-        yearly_total = Expense.get_total_expenses(
-            user_id, 
-            today.replace(month=1, day=1).date(),
-            today.replace(month=12, day=31).date()
-        )
-        
+
+        # Get statistics - one summary-table query covers the monthly,
+        # today and yearly scalars instead of three separate aggregations
+        scalars = Expense.get_dashboard_scalars(
+            user_id, today.year, today.month, today_date)
+
+        if scalars:
+            monthly_total = float(scalars['monthly_total'])
+            monthly_count = int(scalars['monthly_count'])
+            monthly_stats = {
+                'total': monthly_total,
+                'average': monthly_total / monthly_count if monthly_count else 0,
+                'count': monthly_count
+            }
+            today_total = float(scalars['today_total'])
+            yearly_total = float(scalars['yearly_total'])
+        else:
+            # Summary tables unavailable - fall back to per-stat queries
+            monthly_stats = Expense.get_expense_stats(user_id, month_start, month_end)
+            today_total = Expense.get_total_expenses(user_id, today_date, today_date)
+            yearly_total = Expense.get_total_expenses(
+                user_id,
+                today.replace(month=1, day=1).date(),
+                today.replace(month=12, day=31).date()
+            )
+
         # Get category breakdown for current month
         category_totals = Expense.get_category_totals(user_id, month_start, month_end)
         
@@ -199,6 +230,21 @@ class ExpenseController:
             'end_date': end_date
         }
     
+    @staticmethod
+    def get_dow_totals(user_id, start_date=None, end_date=None):
+        """Get spending totals grouped by day of week"""
+        return Expense.get_dow_totals(user_id, start_date, end_date)
+
+    @staticmethod
+    def get_top_expenses(user_id, start_date=None, end_date=None, limit=5):
+        """Get the highest expenses for a period"""
+        return Expense.get_top_expenses(user_id, start_date, end_date, limit)
+
+    @staticmethod
+    def get_top_categories_by_spend(user_id, start_date=None, end_date=None, limit=8):
+        """Get the highest-spend categories for a period"""
+        return Expense.get_category_totals(user_id, start_date, end_date, limit=limit)
+
     @staticmethod
     def export_expenses(user_id, expenses, filepath=None):
         """Export expenses to CSV"""
@@ -280,6 +326,68 @@ class ExpenseController:
             cursor.close()
             conn.close()
     
+    @staticmethod
+    def set_category_budgets_bulk(user_id, budgets):
+        """
+        Save many category budgets in one transaction
+        budgets: {category_id: amount}
+        Returns: True on success
+        """
+        from database.db_connection import DatabaseConnection
+
+        if not budgets:
+            return True
+
+        db = DatabaseConnection()
+        conn = db.get_connection()
+        if not conn:
+            return False
+
+        current_month = datetime.now().strftime('%Y-%m-01')
+        category_ids = list(budgets.keys())
+        rows = [(user_id, cat_id, budgets[cat_id], current_month)
+                for cat_id in category_ids]
+
+        try:
+            cursor = conn.cursor()
+
+            # Replace the existing rows for these categories, then insert
+            # the new values - one commit for the whole batch instead of
+            # a round-trip and fsync per category
+            placeholders = ', '.join(['%s'] * len(category_ids))
+            cursor.execute(
+                f"DELETE FROM budgets WHERE user_id = %s AND category_id IN ({placeholders})",
+                [user_id] + category_ids
+            )
+            cursor.executemany(
+                """INSERT INTO budgets (user_id, category_id, amount, month)
+                   VALUES (%s, %s, %s, %s)""",
+                rows
+            )
+
+            conn.commit()
+            return True
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ Error saving budgets: {e}")
+            return False
+        finally:
+            cursor.close()
+            conn.close()
+
+    @staticmethod
+    def get_all_category_budgets(user_id):
+        """Get every category budget for a user as {category_id: amount}"""
+        from database.db_connection import get_db
+
+        db = get_db()
+        query = "SELECT category_id, amount FROM budgets WHERE user_id = %s"
+        result = db.execute_prepared(query, (user_id,))
+
+        if not result:
+            return {}
+        return {row['category_id']: float(row['amount']) for row in result}
+
     @staticmethod
     def get_category_budget(user_id, category_id):
         """Get budget for a category"""
@@ -7,9 +7,13 @@ import mysql.connector
 from mysql.connector import Error, pooling
 import sys
 import os
+import threading
+from collections import OrderedDict
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# main.py puts the project root on sys.path for normal runs; only add it
+# here when this file is executed directly (python database/db_connection.py)
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.database_config import DB_CONFIG, POOL_CONFIG
 
@@ -19,7 +23,14 @@ class DatabaseConnection:
     
     _instance = None
     _pool = None
-    
+
+    # Server-side prepared statements, cached per SQL text so repeated
+    # queries skip the parse/plan step (LRU-evicted)
+    PREPARED_CACHE_SIZE = 256
+    _prep_connection = None
+    _prep_cursors = OrderedDict()
+    _prep_lock = threading.Lock()
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -28,6 +39,7 @@ class DatabaseConnection:
     def __init__(self):
         if self._pool is None:
             self._create_pool()
+            self._run_migrations()
     
     def _create_pool(self):
         """Create a connection pool"""
@@ -42,7 +54,14 @@ class DatabaseConnection:
         except Error as e:
             print(f"❌ Error creating connection pool: {e}")
             self._pool = None
-    
+
+    def _run_migrations(self):
+        """Apply startup DDL (indexes) once the pool is up"""
+        if self._pool is None:
+            return
+        from database.schema_migrations import run_migrations
+        run_migrations(self)
+
     def get_connection(self):
         """Get a connection from the pool"""
         try:
@@ -85,6 +104,94 @@ class DatabaseConnection:
             if connection:
                 connection.close()
     
+    def _get_prep_connection(self):
+        """Get (or open) the dedicated connection for prepared statements"""
+        if self._prep_connection is None or not self._prep_connection.is_connected():
+            self._reset_prepared()
+            try:
+                DatabaseConnection._prep_connection = mysql.connector.connect(**DB_CONFIG)
+            except Error as e:
+                print(f"❌ Error opening prepared-statement connection: {e}")
+                return None
+        return self._prep_connection
+
+    def _reset_prepared(self):
+        """Drop all cached prepared cursors and the connection behind them"""
+        for cursor in self._prep_cursors.values():
+            try:
+                cursor.close()
+            except Error:
+                pass
+        self._prep_cursors.clear()
+        if self._prep_connection is not None:
+            try:
+                self._prep_connection.close()
+            except Error:
+                pass
+            DatabaseConnection._prep_connection = None
+
+    def execute_prepared(self, query, params=None):
+        """
+        Execute a SELECT through a cached server-side prepared statement.
+
+        The first call for a given SQL text prepares it; subsequent calls
+        reuse the plan. Falls back to execute_query on any error.
+        """
+        with self._prep_lock:
+            try:
+                connection = self._get_prep_connection()
+                if connection is None:
+                    return self.execute_query(query, params)
+
+                cursor = self._prep_cursors.get(query)
+                if cursor is None:
+                    cursor = connection.cursor(prepared=True)
+                    self._prep_cursors[query] = cursor
+                    if len(self._prep_cursors) > self.PREPARED_CACHE_SIZE:
+                        _, old_cursor = self._prep_cursors.popitem(last=False)
+                        old_cursor.close()
+                else:
+                    self._prep_cursors.move_to_end(query)
+
+                cursor.execute(query, params or ())
+                # Prepared cursors return tuples; convert to dicts to keep
+                # the same shape as execute_query
+                columns = cursor.column_names
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+            except Error as e:
+                print(f"❌ Prepared query error: {e}")
+                self._reset_prepared()
+                return self.execute_query(query, params)
+
+    def execute_iter(self, query, params=None, batch_size=256):
+        """
+        Stream query results instead of materializing the full set.
+
+        Uses an unbuffered cursor and yields rows in fetchmany batches, so
+        large exports/scans never hold the whole result in memory. The
+        connection is held until the generator is exhausted or closed.
+        """
+        connection = self.get_connection()
+        if connection is None:
+            return
+        cursor = None
+        try:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+        except Error as e:
+            print(f"❌ Streaming query error: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+            connection.close()
+
     def execute_many(self, query, data_list):
         """Execute multiple inserts"""
         connection = None
@@ -0,0 +1,267 @@
+"""
+Schema Migrations
+Startup DDL that keeps indexes and summary tables in sync with the
+query patterns in the models
+"""
+
+from mysql.connector import Error
+
+
+# Indexes that support the hot Expense query paths:
+# - (user_id, expense_date DESC, category_id) covers the filter + range scan
+#   + join key used by get_user_expenses / get_total_expenses / get_expense_stats
+# - (user_id, created_at DESC) covers the ORDER BY tiebreaker in get_user_expenses
+# - FULLTEXT (description, notes) supports text search without a full table scan
+INDEX_DDL = [
+    ('idx_expenses_user_date_cat',
+     "CREATE INDEX idx_expenses_user_date_cat "
+     "ON expenses(user_id, expense_date DESC, category_id)"),
+    ('idx_expenses_user_created',
+     "CREATE INDEX idx_expenses_user_created "
+     "ON expenses(user_id, created_at DESC)"),
+    ('idx_expense_text',
+     "CREATE FULLTEXT INDEX idx_expense_text "
+     "ON expenses(description, notes)"),
+]
+
+
+def _index_exists(cursor, table, index_name):
+    """Check information_schema for an existing index"""
+    cursor.execute(
+        """
+        SELECT COUNT(*) FROM information_schema.statistics
+        WHERE table_schema = DATABASE()
+          AND table_name = %s AND index_name = %s
+        """,
+        (table, index_name)
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def ensure_indexes(connection):
+    """Create any missing indexes (MySQL has no CREATE INDEX IF NOT EXISTS)"""
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        for name, ddl in INDEX_DDL:
+            if not _index_exists(cursor, 'expenses', name):
+                cursor.execute(ddl)
+                print(f"✅ Created index {name}")
+        connection.commit()
+    except Error as e:
+        print(f"⚠️ Could not ensure indexes: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+
+
+# Summary tables that emulate materialized views (MySQL has none).
+# Dashboards read these pre-aggregated rows instead of re-scanning the
+# user's full expense history; triggers on expenses keep them current.
+SUMMARY_TABLE_DDL = {
+    'mv_expense_cat_totals': """
+        CREATE TABLE IF NOT EXISTS mv_expense_cat_totals (
+            user_id INT NOT NULL,
+            category_id INT NOT NULL,
+            ym CHAR(7) NOT NULL,
+            total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, ym, category_id)
+        )
+    """,
+    'mv_expense_monthly': """
+        CREATE TABLE IF NOT EXISTS mv_expense_monthly (
+            user_id INT NOT NULL,
+            year INT NOT NULL,
+            month INT NOT NULL,
+            total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, year, month)
+        )
+    """,
+    'mv_expense_daily': """
+        CREATE TABLE IF NOT EXISTS mv_expense_daily (
+            user_id INT NOT NULL,
+            expense_date DATE NOT NULL,
+            total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, expense_date)
+        )
+    """,
+    'user_stats': """
+        CREATE TABLE IF NOT EXISTS user_stats (
+            user_id INT NOT NULL PRIMARY KEY,
+            total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            count INT NOT NULL DEFAULT 0,
+            max_amount DECIMAL(10, 2) NOT NULL DEFAULT 0,
+            min_amount DECIMAL(10, 2) NOT NULL DEFAULT 0
+        )
+    """,
+}
+
+BACKFILL_SQL = {
+    'mv_expense_cat_totals': """
+        INSERT INTO mv_expense_cat_totals (user_id, category_id, ym, total, count)
+        SELECT user_id, category_id, DATE_FORMAT(expense_date, '%Y-%m'),
+               SUM(amount), COUNT(*)
+        FROM expenses
+        GROUP BY user_id, category_id, DATE_FORMAT(expense_date, '%Y-%m')
+    """,
+    'mv_expense_monthly': """
+        INSERT INTO mv_expense_monthly (user_id, year, month, total, count)
+        SELECT user_id, YEAR(expense_date), MONTH(expense_date),
+               SUM(amount), COUNT(*)
+        FROM expenses
+        GROUP BY user_id, YEAR(expense_date), MONTH(expense_date)
+    """,
+    'mv_expense_daily': """
+        INSERT INTO mv_expense_daily (user_id, expense_date, total, count)
+        SELECT user_id, expense_date, SUM(amount), COUNT(*)
+        FROM expenses
+        GROUP BY user_id, expense_date
+    """,
+    'user_stats': """
+        INSERT INTO user_stats (user_id, total, count, max_amount, min_amount)
+        SELECT user_id, SUM(amount), COUNT(*), MAX(amount), MIN(amount)
+        FROM expenses
+        GROUP BY user_id
+    """,
+}
+
+# Shared upsert fragments used by the three triggers
+_ADD_ROW = """
+    INSERT INTO mv_expense_cat_totals (user_id, category_id, ym, total, count)
+    VALUES ({row}.user_id, {row}.category_id, DATE_FORMAT({row}.expense_date, '%Y-%m'), {row}.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + {row}.amount, count = count + 1;
+    INSERT INTO mv_expense_monthly (user_id, year, month, total, count)
+    VALUES ({row}.user_id, YEAR({row}.expense_date), MONTH({row}.expense_date), {row}.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + {row}.amount, count = count + 1;
+    INSERT INTO mv_expense_daily (user_id, expense_date, total, count)
+    VALUES ({row}.user_id, {row}.expense_date, {row}.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + {row}.amount, count = count + 1;
+    INSERT INTO user_stats (user_id, total, count, max_amount, min_amount)
+    VALUES ({row}.user_id, {row}.amount, 1, {row}.amount, {row}.amount)
+    ON DUPLICATE KEY UPDATE total = total + {row}.amount, count = count + 1,
+        -- count is already incremented (assignments run left to right), so
+        -- count = 1 means the row was empty and the 0-sentinel extremes
+        -- must be re-seeded rather than folded into LEAST/GREATEST
+        max_amount = IF(count = 1, {row}.amount, GREATEST(max_amount, {row}.amount)),
+        min_amount = IF(count = 1, {row}.amount, LEAST(min_amount, {row}.amount));
+"""
+
+_REMOVE_ROW = """
+    UPDATE mv_expense_cat_totals
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND category_id = OLD.category_id
+      AND ym = DATE_FORMAT(OLD.expense_date, '%Y-%m');
+    UPDATE mv_expense_monthly
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND year = YEAR(OLD.expense_date)
+      AND month = MONTH(OLD.expense_date);
+    UPDATE mv_expense_daily
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND expense_date = OLD.expense_date;
+    UPDATE user_stats
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id;
+    UPDATE user_stats
+    SET max_amount = COALESCE((SELECT MAX(amount) FROM expenses WHERE user_id = OLD.user_id), 0),
+        min_amount = COALESCE((SELECT MIN(amount) FROM expenses WHERE user_id = OLD.user_id), 0)
+    WHERE user_id = OLD.user_id
+      AND (OLD.amount >= max_amount OR OLD.amount <= min_amount);
+"""
+
+TRIGGER_DDL = [
+    ('trg_expenses_summary_ai',
+     "CREATE TRIGGER trg_expenses_summary_ai AFTER INSERT ON expenses FOR EACH ROW\n"
+     "BEGIN\n" + _ADD_ROW.format(row='NEW') + "END"),
+    ('trg_expenses_summary_ad',
+     "CREATE TRIGGER trg_expenses_summary_ad AFTER DELETE ON expenses FOR EACH ROW\n"
+     "BEGIN\n" + _REMOVE_ROW + "END"),
+    ('trg_expenses_summary_au',
+     "CREATE TRIGGER trg_expenses_summary_au AFTER UPDATE ON expenses FOR EACH ROW\n"
+     "BEGIN\n" + _REMOVE_ROW + _ADD_ROW.format(row='NEW') + "END"),
+]
+
+
+def _table_exists(cursor, table):
+    """Check information_schema for an existing table"""
+    cursor.execute(
+        """
+        SELECT COUNT(*) FROM information_schema.tables
+        WHERE table_schema = DATABASE() AND table_name = %s
+        """,
+        (table,)
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def _trigger_body(cursor, trigger_name):
+    """Get an existing trigger's body from information_schema (None if absent)"""
+    cursor.execute(
+        """
+        SELECT action_statement FROM information_schema.triggers
+        WHERE trigger_schema = DATABASE() AND trigger_name = %s
+        """,
+        (trigger_name,)
+    )
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+# Marks the fixed min/max re-seed; installs whose triggers predate it
+# get the trigger dropped and recreated on startup
+_TRIGGER_FIX_MARKER = 'IF(count = 1'
+
+# One-time repair for rows the old delete-path corrupted (min pinned at
+# the 0 sentinel after a user emptied their expenses)
+_STATS_REPAIR_SQL = """
+    UPDATE user_stats us
+    SET max_amount = COALESCE((SELECT MAX(amount) FROM expenses e WHERE e.user_id = us.user_id), 0),
+        min_amount = COALESCE((SELECT MIN(amount) FROM expenses e WHERE e.user_id = us.user_id), 0)
+"""
+
+
+def ensure_summary_tables(connection):
+    """Create summary tables, backfill them, and install maintenance triggers"""
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        for table, ddl in SUMMARY_TABLE_DDL.items():
+            if not _table_exists(cursor, table):
+                cursor.execute(ddl)
+                cursor.execute(BACKFILL_SQL[table])
+                print(f"✅ Created summary table {table}")
+        repaired = False
+        for name, ddl in TRIGGER_DDL:
+            body = _trigger_body(cursor, name)
+            if (body is not None and _TRIGGER_FIX_MARKER in ddl
+                    and _TRIGGER_FIX_MARKER not in body):
+                # Outdated definition - replace it and fix the stats it
+                # may have corrupted
+                cursor.execute(f"DROP TRIGGER {name}")
+                body = None
+                if not repaired:
+                    cursor.execute(_STATS_REPAIR_SQL)
+                    repaired = True
+                print(f"✅ Refreshed summary trigger {name}")
+            if body is None:
+                cursor.execute(ddl)
+        connection.commit()
+    except Error as e:
+        print(f"⚠️ Could not ensure summary tables: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+
+
+def run_migrations(db):
+    """Run startup migrations using a pooled connection"""
+    connection = db.get_connection()
+    if connection is None:
+        return
+    try:
+        ensure_indexes(connection)
+        ensure_summary_tables(connection)
+    finally:
+        connection.close()
@@ -92,6 +92,13 @@ CREATE INDEX idx_expenses_date ON expenses(expense_date);
 CREATE INDEX idx_expenses_category ON expenses(category_id);
 CREATE INDEX idx_budgets_user ON budgets(user_id);
 
+-- Composite indexes covering the hot filter/sort paths
+CREATE INDEX idx_expenses_user_date_cat ON expenses(user_id, expense_date DESC, category_id);
+CREATE INDEX idx_expenses_user_created ON expenses(user_id, created_at DESC);
+
+-- Full-text index for expense search
+CREATE FULLTEXT INDEX idx_expense_text ON expenses(description, notes);
+
 -- =============================================
 -- VIEWS FOR COMMON QUERIES
 -- =============================================
@@ -120,6 +127,134 @@ SELECT
 FROM expenses e
 GROUP BY e.user_id, e.expense_date;
 
+-- =============================================
+-- SUMMARY TABLES (materialized-view emulation)
+-- Kept current by the triggers below; dashboards
+-- read these instead of re-aggregating expenses
+-- =============================================
+
+CREATE TABLE IF NOT EXISTS mv_expense_cat_totals (
+    user_id INT NOT NULL,
+    category_id INT NOT NULL,
+    ym CHAR(7) NOT NULL,
+    total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, ym, category_id)
+);
+
+CREATE TABLE IF NOT EXISTS mv_expense_monthly (
+    user_id INT NOT NULL,
+    year INT NOT NULL,
+    month INT NOT NULL,
+    total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, year, month)
+);
+
+CREATE TABLE IF NOT EXISTS mv_expense_daily (
+    user_id INT NOT NULL,
+    expense_date DATE NOT NULL,
+    total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, expense_date)
+);
+
+CREATE TABLE IF NOT EXISTS user_stats (
+    user_id INT NOT NULL PRIMARY KEY,
+    total DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    count INT NOT NULL DEFAULT 0,
+    max_amount DECIMAL(10, 2) NOT NULL DEFAULT 0,
+    min_amount DECIMAL(10, 2) NOT NULL DEFAULT 0
+);
+
+DELIMITER //
+
+CREATE TRIGGER trg_expenses_summary_ai AFTER INSERT ON expenses FOR EACH ROW
+BEGIN
+    INSERT INTO mv_expense_cat_totals (user_id, category_id, ym, total, count)
+    VALUES (NEW.user_id, NEW.category_id, DATE_FORMAT(NEW.expense_date, '%Y-%m'), NEW.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1;
+    INSERT INTO mv_expense_monthly (user_id, year, month, total, count)
+    VALUES (NEW.user_id, YEAR(NEW.expense_date), MONTH(NEW.expense_date), NEW.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1;
+    INSERT INTO mv_expense_daily (user_id, expense_date, total, count)
+    VALUES (NEW.user_id, NEW.expense_date, NEW.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1;
+    INSERT INTO user_stats (user_id, total, count, max_amount, min_amount)
+    VALUES (NEW.user_id, NEW.amount, 1, NEW.amount, NEW.amount)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1,
+        -- count is already incremented (assignments run left to right), so
+        -- count = 1 means the row was empty and the 0-sentinel extremes
+        -- must be re-seeded rather than folded into LEAST/GREATEST
+        max_amount = IF(count = 1, NEW.amount, GREATEST(max_amount, NEW.amount)),
+        min_amount = IF(count = 1, NEW.amount, LEAST(min_amount, NEW.amount));
+END //
+
+CREATE TRIGGER trg_expenses_summary_ad AFTER DELETE ON expenses FOR EACH ROW
+BEGIN
+    UPDATE mv_expense_cat_totals
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND category_id = OLD.category_id
+      AND ym = DATE_FORMAT(OLD.expense_date, '%Y-%m');
+    UPDATE mv_expense_monthly
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND year = YEAR(OLD.expense_date)
+      AND month = MONTH(OLD.expense_date);
+    UPDATE mv_expense_daily
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND expense_date = OLD.expense_date;
+    UPDATE user_stats
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id;
+    UPDATE user_stats
+    SET max_amount = COALESCE((SELECT MAX(amount) FROM expenses WHERE user_id = OLD.user_id), 0),
+        min_amount = COALESCE((SELECT MIN(amount) FROM expenses WHERE user_id = OLD.user_id), 0)
+    WHERE user_id = OLD.user_id
+      AND (OLD.amount >= max_amount OR OLD.amount <= min_amount);
+END //
+
+CREATE TRIGGER trg_expenses_summary_au AFTER UPDATE ON expenses FOR EACH ROW
+BEGIN
+    UPDATE mv_expense_cat_totals
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND category_id = OLD.category_id
+      AND ym = DATE_FORMAT(OLD.expense_date, '%Y-%m');
+    UPDATE mv_expense_monthly
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND year = YEAR(OLD.expense_date)
+      AND month = MONTH(OLD.expense_date);
+    UPDATE mv_expense_daily
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id AND expense_date = OLD.expense_date;
+    UPDATE user_stats
+    SET total = total - OLD.amount, count = count - 1
+    WHERE user_id = OLD.user_id;
+    UPDATE user_stats
+    SET max_amount = COALESCE((SELECT MAX(amount) FROM expenses WHERE user_id = OLD.user_id), 0),
+        min_amount = COALESCE((SELECT MIN(amount) FROM expenses WHERE user_id = OLD.user_id), 0)
+    WHERE user_id = OLD.user_id
+      AND (OLD.amount >= max_amount OR OLD.amount <= min_amount);
+    INSERT INTO mv_expense_cat_totals (user_id, category_id, ym, total, count)
+    VALUES (NEW.user_id, NEW.category_id, DATE_FORMAT(NEW.expense_date, '%Y-%m'), NEW.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1;
+    INSERT INTO mv_expense_monthly (user_id, year, month, total, count)
+    VALUES (NEW.user_id, YEAR(NEW.expense_date), MONTH(NEW.expense_date), NEW.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1;
+    INSERT INTO mv_expense_daily (user_id, expense_date, total, count)
+    VALUES (NEW.user_id, NEW.expense_date, NEW.amount, 1)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1;
+    INSERT INTO user_stats (user_id, total, count, max_amount, min_amount)
+    VALUES (NEW.user_id, NEW.amount, 1, NEW.amount, NEW.amount)
+    ON DUPLICATE KEY UPDATE total = total + NEW.amount, count = count + 1,
+        -- count is already incremented (assignments run left to right), so
+        -- count = 1 means the row was empty and the 0-sentinel extremes
+        -- must be re-seeded rather than folded into LEAST/GREATEST
+        max_amount = IF(count = 1, NEW.amount, GREATEST(max_amount, NEW.amount)),
+        min_amount = IF(count = 1, NEW.amount, LEAST(min_amount, NEW.amount));
+END //
+
+DELIMITER ;
+
 -- =============================================
 -- STORED PROCEDURES
 -- =============================================
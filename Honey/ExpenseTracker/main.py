@@ -96,12 +96,18 @@ class ExpenseTrackerApp:
             padding=8
         )
     
+    def clear_root(self):
+        """Destroy the root's children, sparing the cached login panel"""
+        keep = LoginView.detach_cached_panel()
+        for widget in self.root.winfo_children():
+            if widget is not keep:
+                widget.destroy()
+
     def show_login(self):
         """Show login view"""
         # Clear root
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
+        self.clear_root()
+
         # Show login
         login_view = LoginView(self.root, self.on_login_success)
         login_view.pack(fill=tk.BOTH, expand=True)
@@ -114,8 +120,7 @@ class ExpenseTrackerApp:
     def show_main_app(self):
         """Show main application with sidebar"""
         # Clear root
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        self.clear_root()
         
         # Main container
         main_container = tk.Frame(self.root, bg=COLORS['bg_primary'])
@@ -187,8 +192,8 @@ class ExpenseTrackerApp:
         
         self.nav_buttons = {}
         
-        for item in MENU_ITEMS:
-            self.create_nav_item(nav_frame, item)
+        for key, label, icon in MENU_ITEMS:
+            self.create_nav_item(nav_frame, key, label, icon)
         
         # Spacer
         tk.Frame(sidebar, bg=COLORS['sidebar_bg']).pack(fill=tk.BOTH, expand=True)
@@ -257,11 +262,11 @@ class ExpenseTrackerApp:
         
         return sidebar
     
-    def create_nav_item(self, parent, item):
+    def create_nav_item(self, parent, key, label, icon):
         """Create navigation menu item"""
         btn = tk.Button(
             parent,
-            text=f"  {item['icon']}  {item['label']}",
+            text=f"  {icon}  {label}",
             font=FONTS['body_medium'],
             bg=COLORS['sidebar_bg'],
             fg=COLORS['text_light'],
@@ -272,23 +277,23 @@ class ExpenseTrackerApp:
             cursor='hand2',
             padx=15,
             pady=12,
-            command=lambda k=item['key']: self.navigate_to(k)
+            command=lambda k=key: self.navigate_to(k)
         )
         btn.pack(fill=tk.X, pady=2)
-        
+
         # Hover effects
-        def on_enter(e, button=btn, key=item['key']):
+        def on_enter(e, button=btn, key=key):
             if self.current_view_name != key:
                 button.config(bg=COLORS['sidebar_hover'])
-        
-        def on_leave(e, button=btn, key=item['key']):
+
+        def on_leave(e, button=btn, key=key):
             if self.current_view_name != key:
                 button.config(bg=COLORS['sidebar_bg'])
-        
+
         btn.bind('<Enter>', on_enter)
         btn.bind('<Leave>', on_leave)
-        
-        self.nav_buttons[item['key']] = btn
+
+        self.nav_buttons[key] = btn
     
     def update_nav_selection(self, key):
         """Update navigation button selection"""
@@ -3,17 +3,116 @@ Expense Model
 Handles expense-related database operations
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from database.db_connection import get_db
+from utils.query_cache import cached_query, invalidate_user
 from datetime import datetime, date
+from itertools import product
+import time
+
+
+def _build_user_expenses_sql():
+    """
+    Enumerate every get_user_expenses filter combination once at import
+    time. Call sites index the dict by a bool tuple instead of
+    concatenating SQL per call, which also keeps the statement text
+    stable for the prepared-statement cache.
+    """
+    base = """
+        SELECT *
+        FROM expenses
+        WHERE user_id = %s
+    """
+    variants = {}
+    for has_start, has_end, has_cat, has_after, has_limit in product((False, True), repeat=5):
+        sql = base
+        if has_start:
+            sql += " AND expense_date >= %s"
+        if has_end:
+            sql += " AND expense_date <= %s"
+        if has_cat:
+            sql += " AND category_id = %s"
+        if has_after:
+            sql += " AND (expense_date, created_at, expense_id) < (%s, %s, %s)"
+        sql += " ORDER BY expense_date DESC, created_at DESC, expense_id DESC"
+        if has_limit:
+            sql += " LIMIT %s OFFSET %s"
+        variants[(has_start, has_end, has_cat, has_after, has_limit)] = sql
+    return variants
+
+
+def _build_filtered_sql(base):
+    """Variants of an aggregate query with optional date/category filters"""
+    variants = {}
+    for has_start, has_end, has_cat in product((False, True), repeat=3):
+        sql = base
+        if has_start:
+            sql += " AND expense_date >= %s"
+        if has_end:
+            sql += " AND expense_date <= %s"
+        if has_cat:
+            sql += " AND category_id = %s"
+        variants[(has_start, has_end, has_cat)] = sql
+    return variants
+
+
+_USER_EXPENSES_SQL = _build_user_expenses_sql()
+
+_TOTAL_EXPENSES_SQL = _build_filtered_sql("""
+    SELECT COALESCE(SUM(amount), 0) as total
+    FROM expenses
+    WHERE user_id = %s
+""")
+
+_EXPENSE_STATS_SQL = _build_filtered_sql("""
+    SELECT
+        COALESCE(SUM(amount), 0) as total,
+        COALESCE(AVG(amount), 0) as average,
+        COALESCE(MAX(amount), 0) as max_expense,
+        COALESCE(MIN(amount), 0) as min_expense,
+        COUNT(*) as count
+    FROM expenses
+    WHERE user_id = %s
+""")
+
+
+# Categories are tiny (~12 rows) and effectively read-only, so expense
+# queries no longer JOIN them on the server. Rows fetch only expenses.*
+# and the name/icon/color are filled in from this cache in _from_row.
+_CATEGORY_TTL_SECONDS = 300
+_categories_by_id = {}
+_categories_expire_at = 0.0
+
+
+def _get_category(category_id):
+    """Cached Category lookup by id, refreshed lazily on a 5-minute TTL"""
+    global _categories_expire_at
+    now = time.monotonic()
+    if now >= _categories_expire_at or category_id not in _categories_by_id:
+        _categories_by_id.update(
+            {c.category_id: c for c in Category.get_all()})
+        _categories_expire_at = now + _CATEGORY_TTL_SECONDS
+    return _categories_by_id.get(category_id)
+
+
+def _month_start(value):
+    """Return the value as a date if it is the first day of a month, else None"""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date) and value.day == 1:
+        return value
+    return None
 
 
 class Expense:
     """Expense model class"""
-    
+
+    # Fixed attribute set - avoids a per-instance __dict__, which matters
+    # when building thousands of rows for the list/analytics views
+    __slots__ = ('expense_id', 'user_id', 'category_id', 'amount',
+                 'description', 'expense_date', 'payment_method', 'notes',
+                 'category_name', 'category_icon', 'category_color',
+                 'created_at', 'updated_at')
+
     def __init__(self, expense_id=None, user_id=None, category_id=None,
                  amount=None, description=None, expense_date=None,
                  payment_method='Cash', notes=None, category_name=None,
@@ -32,7 +131,34 @@ class Expense:
         self.category_color = category_color
         self.created_at = created_at
         self.updated_at = updated_at
-    
+
+    @classmethod
+    def _from_row(cls, row):
+        """Build an Expense straight from a cursor row (no kwargs dispatch)"""
+        expense = cls.__new__(cls)
+        expense.expense_id = row['expense_id']
+        expense.user_id = row['user_id']
+        expense.category_id = row['category_id']
+        # Convert the driver's Decimal once here so every later consumer
+        # (to_dict, chart math, formatting) gets a plain float
+        expense.amount = float(row['amount'])
+        expense.description = row['description']
+        expense.expense_date = row['expense_date']
+        expense.payment_method = row['payment_method']
+        expense.notes = row['notes']
+        category = _get_category(row['category_id'])
+        if category is not None:
+            expense.category_name = category.category_name
+            expense.category_icon = category.icon
+            expense.category_color = category.color
+        else:
+            expense.category_name = row.get('category_name')
+            expense.category_icon = row.get('category_icon')
+            expense.category_color = row.get('category_color')
+        expense.created_at = row.get('created_at')
+        expense.updated_at = row.get('updated_at')
+        return expense
+
     @staticmethod
     def create(user_id, category_id, amount, description, expense_date, 
                payment_method='Cash', notes=None):
@@ -52,108 +178,185 @@ class Expense:
         )
         
         if expense_id:
-            return Expense(expense_id=expense_id, user_id=user_id, 
+            invalidate_user(user_id)
+            return Expense(expense_id=expense_id, user_id=user_id,
                           category_id=category_id, amount=amount,
                           description=description, expense_date=expense_date,
                           payment_method=payment_method, notes=notes)
         return None
-    
+
+    @staticmethod
+    def bulk_create(user_id, expenses):
+        """
+        Insert many expenses in one batch (e.g. CSV import).
+
+        `expenses` is a list of dicts with the same keys create() takes.
+        All rows go through a single executemany/commit instead of one
+        INSERT round-trip per expense.
+        """
+        if not expenses:
+            return True
+
+        db = get_db()
+
+        query = """
+            INSERT INTO expenses (user_id, category_id, amount, description,
+                                 expense_date, payment_method, notes)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """
+
+        rows = [
+            (user_id, item['category_id'], item['amount'], item['description'],
+             item['expense_date'], item.get('payment_method', 'Cash'),
+             item.get('notes'))
+            for item in expenses
+        ]
+
+        success = db.execute_many(query, rows)
+        if success:
+            invalidate_user(user_id)
+        return success
+
+
     @staticmethod
     def get_by_id(expense_id, user_id=None):
         """Get expense by ID"""
         db = get_db()
         
         query = """
-            SELECT e.*, c.category_name, c.icon as category_icon, c.color as category_color
-            FROM expenses e
-            JOIN categories c ON e.category_id = c.category_id
-            WHERE e.expense_id = %s
+            SELECT *
+            FROM expenses
+            WHERE expense_id = %s
         """
         params = [expense_id]
-        
+
         if user_id:
-            query += " AND e.user_id = %s"
+            query += " AND user_id = %s"
             params.append(user_id)
         
         result = db.execute_query(query, tuple(params))
         
         if result and len(result) > 0:
-            data = result[0]
-            return Expense(**data)
+            return Expense._from_row(result[0])
         return None
     
     @staticmethod
-    def get_user_expenses(user_id, start_date=None, end_date=None, 
-                         category_id=None, limit=None, offset=0):
-        """Get expenses for a user with optional filters"""
-        db = get_db()
-        
-        query = """
-            SELECT e.*, c.category_name, c.icon as category_icon, c.color as category_color
-            FROM expenses e
-            JOIN categories c ON e.category_id = c.category_id
-            WHERE e.user_id = %s
+    def get_user_expenses(user_id, start_date=None, end_date=None,
+                         category_id=None, limit=None, offset=0, after=None):
+        """
+        Get expenses for a user with optional filters.
+
+        `after` is a keyset cursor - the (expense_date, created_at,
+        expense_id) triple of the last row of the previous page (see
+        page_cursor). Unlike OFFSET it stays O(log N) for deep pages.
         """
+        db = get_db()
+
         params = [user_id]
-        
         if start_date:
-            query += " AND e.expense_date >= %s"
             params.append(start_date)
-        
         if end_date:
-            query += " AND e.expense_date <= %s"
             params.append(end_date)
-        
         if category_id:
-            query += " AND e.category_id = %s"
             params.append(category_id)
-        
-        query += " ORDER BY e.expense_date DESC, e.created_at DESC"
-        
+        if after:
+            params.extend(after)
         if limit:
-            query += f" LIMIT {limit} OFFSET {offset}"
-        
-        result = db.execute_query(query, tuple(params))
+            params.append(int(limit))
+            params.append(int(offset))
+
+        query = _USER_EXPENSES_SQL[(bool(start_date), bool(end_date),
+                                    bool(category_id), bool(after), bool(limit))]
+        result = db.execute_prepared(query, tuple(params))
         
         if result:
-            return [Expense(**data) for data in result]
+            return [Expense._from_row(data) for data in result]
         return []
     
     @staticmethod
+    def iter_user_expenses(user_id, start_date=None, end_date=None,
+                           category_id=None):
+        """
+        Stream a user's expenses lazily instead of building the full list.
+
+        Meant for exports and analytics passes over unbounded histories -
+        rows are pulled from the server in batches and turned into Expense
+        objects one at a time.
+        """
+        db = get_db()
+
+        params = [user_id]
+        if start_date:
+            params.append(start_date)
+        if end_date:
+            params.append(end_date)
+        if category_id:
+            params.append(category_id)
+
+        query = _USER_EXPENSES_SQL[(bool(start_date), bool(end_date),
+                                    bool(category_id), False, False)]
+        for row in db.execute_iter(query, tuple(params)):
+            yield Expense._from_row(row)
+
+    @staticmethod
+    def page_cursor(expenses):
+        """Keyset cursor for the page after `expenses`, or None at the end"""
+        if not expenses:
+            return None
+        last = expenses[-1]
+        return (last.expense_date, last.created_at, last.expense_id)
+
+    @staticmethod
+    @cached_query
     def get_total_expenses(user_id, start_date=None, end_date=None, category_id=None):
         """Get total expenses for a user"""
         db = get_db()
-        
-        query = """
-            SELECT COALESCE(SUM(amount), 0) as total
-            FROM expenses
-            WHERE user_id = %s
-        """
+
         params = [user_id]
-        
         if start_date:
-            query += " AND expense_date >= %s"
             params.append(start_date)
-        
         if end_date:
-            query += " AND expense_date <= %s"
             params.append(end_date)
-        
         if category_id:
-            query += " AND category_id = %s"
             params.append(category_id)
-        
-        result = db.execute_query(query, tuple(params))
+
+        query = _TOTAL_EXPENSES_SQL[(bool(start_date), bool(end_date), bool(category_id))]
+        result = db.execute_prepared(query, tuple(params))
         
         if result:
             return float(result[0]['total'])
         return 0.0
     
     @staticmethod
-    def get_category_totals(user_id, start_date=None, end_date=None):
-        """Get expense totals by category"""
+    @cached_query
+    def get_category_totals(user_id, start_date=None, end_date=None, limit=None):
+        """Get expense totals by category (highest spend first)"""
         db = get_db()
-        
+
+        # Month-aligned ranges (the dashboard's "current month" case) can be
+        # served from the pre-aggregated summary table instead of scanning
+        # the user's full expense history
+        start = _month_start(start_date)
+        end = _month_start(end_date)
+        if start and end:
+            query = """
+                SELECT c.category_id, c.category_name, c.icon, c.color,
+                       COALESCE(SUM(m.total), 0) as total,
+                       COALESCE(SUM(m.count), 0) as count
+                FROM categories c
+                LEFT JOIN mv_expense_cat_totals m ON m.category_id = c.category_id
+                    AND m.user_id = %s AND m.ym >= %s AND m.ym < %s
+                GROUP BY c.category_id
+                ORDER BY total DESC
+            """
+            params = [user_id, start.strftime('%Y-%m'), end.strftime('%Y-%m')]
+            if limit:
+                query += " LIMIT %s"
+                params.append(limit)
+            result = db.execute_prepared(query, tuple(params))
+            if result is not None:
+                return result
+
         query = """
             SELECT c.category_id, c.category_name, c.icon, c.color,
                    COALESCE(SUM(e.amount), 0) as total,
@@ -176,26 +379,45 @@ class Expense:
             GROUP BY c.category_id
             ORDER BY total DESC
         """
-        
+
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+
         result = db.execute_query(query, tuple(params))
         return result if result else []
     
     @staticmethod
+    @cached_query
     def get_monthly_totals(user_id, year):
         """Get monthly expense totals for a year"""
         db = get_db()
-        
+
+        # Read the pre-aggregated summary table (one row per month)
         query = """
-            SELECT MONTH(expense_date) as month,
-                   COALESCE(SUM(amount), 0) as total,
-                   COUNT(*) as count
-            FROM expenses
-            WHERE user_id = %s AND YEAR(expense_date) = %s
-            GROUP BY MONTH(expense_date)
+            SELECT month, total, count
+            FROM mv_expense_monthly
+            WHERE user_id = %s AND year = %s
             ORDER BY month
         """
-        
-        result = db.execute_query(query, (user_id, year))
+
+        result = db.execute_prepared(query, (user_id, year))
+
+        if result is None:
+            # Summary table unavailable - aggregate live with a sargable
+            # half-open range so the (user_id, expense_date) index serves it
+            start = date(year, 1, 1)
+            end = date(year + 1, 1, 1)
+            query = """
+                SELECT MONTH(expense_date) as month,
+                       COALESCE(SUM(amount), 0) as total,
+                       COUNT(*) as count
+                FROM expenses
+                WHERE user_id = %s AND expense_date >= %s AND expense_date < %s
+                GROUP BY MONTH(expense_date)
+                ORDER BY month
+            """
+            result = db.execute_query(query, (user_id, start, end))
         
         # Fill in missing months with 0
         monthly_data = {i: {'month': i, 'total': 0, 'count': 0} for i in range(1, 13)}
@@ -206,51 +428,163 @@ class Expense:
         return list(monthly_data.values())
     
     @staticmethod
+    @cached_query
     def get_daily_totals(user_id, year, month):
         """Get daily expense totals for a month"""
         db = get_db()
         
+        start = date(year, month, 1)
+        if month == 12:
+            end = date(year + 1, 1, 1)
+        else:
+            end = date(year, month + 1, 1)
+
+        # Read the pre-aggregated summary table (one row per day)
         query = """
-            SELECT DAY(expense_date) as day,
-                   COALESCE(SUM(amount), 0) as total,
-                   COUNT(*) as count
-            FROM expenses
-            WHERE user_id = %s 
-              AND YEAR(expense_date) = %s 
-              AND MONTH(expense_date) = %s
-            GROUP BY DAY(expense_date)
+            SELECT DAY(expense_date) as day, total, count
+            FROM mv_expense_daily
+            WHERE user_id = %s AND expense_date >= %s AND expense_date < %s
             ORDER BY day
         """
-        
-        result = db.execute_query(query, (user_id, year, month))
+
+        result = db.execute_prepared(query, (user_id, start, end))
+
+        if result is None:
+            # Summary table unavailable - aggregate live over the same
+            # sargable half-open range
+            query = """
+                SELECT DAY(expense_date) as day,
+                       COALESCE(SUM(amount), 0) as total,
+                       COUNT(*) as count
+                FROM expenses
+                WHERE user_id = %s AND expense_date >= %s AND expense_date < %s
+                GROUP BY DAY(expense_date)
+                ORDER BY day
+            """
+            result = db.execute_query(query, (user_id, start, end))
+
         return result if result else []
     
     @staticmethod
-    def get_expense_stats(user_id, start_date=None, end_date=None):
-        """Get expense statistics"""
+    @cached_query
+    def get_dashboard_scalars(user_id, year, month, today):
+        """
+        Get the dashboard's scalar stats in one summary-table query
+        Returns: {yearly_total, monthly_total, monthly_count, today_total}
+        or None when the summary tables are unavailable
+        """
         db = get_db()
-        
+
         query = """
-            SELECT 
-                COALESCE(SUM(amount), 0) as total,
-                COALESCE(AVG(amount), 0) as average,
-                COALESCE(MAX(amount), 0) as max_expense,
-                COALESCE(MIN(amount), 0) as min_expense,
-                COUNT(*) as count
+            SELECT COALESCE(SUM(m.total), 0) as yearly_total,
+                   COALESCE(SUM(CASE WHEN m.month = %s THEN m.total END), 0) as monthly_total,
+                   COALESCE(SUM(CASE WHEN m.month = %s THEN m.count END), 0) as monthly_count,
+                   COALESCE((SELECT d.total FROM mv_expense_daily d
+                             WHERE d.user_id = %s AND d.expense_date = %s), 0) as today_total
+            FROM mv_expense_monthly m
+            WHERE m.user_id = %s AND m.year = %s
+        """
+
+        result = db.execute_prepared(
+            query, (month, month, user_id, today, user_id, year))
+
+        if result:
+            return result[0]
+        return None
+
+    @staticmethod
+    @cached_query
+    def get_dow_totals(user_id, start_date=None, end_date=None):
+        """Get expense totals grouped by day of week (Monday = 0)"""
+        db = get_db()
+
+        query = """
+            SELECT WEEKDAY(expense_date) as dow,
+                   COALESCE(SUM(amount), 0) as total,
+                   COUNT(DISTINCT expense_date) as days
             FROM expenses
             WHERE user_id = %s
         """
         params = [user_id]
-        
+
         if start_date:
             query += " AND expense_date >= %s"
             params.append(start_date)
-        
+
         if end_date:
             query += " AND expense_date <= %s"
             params.append(end_date)
-        
-        result = db.execute_query(query, tuple(params))
+
+        query += " GROUP BY WEEKDAY(expense_date)"
+
+        result = db.execute_prepared(query, tuple(params))
+        return result if result else []
+
+    @staticmethod
+    def get_top_expenses(user_id, start_date=None, end_date=None, limit=5):
+        """Get the largest expenses in a period"""
+        db = get_db()
+
+        query = """
+            SELECT *
+            FROM expenses
+            WHERE user_id = %s
+        """
+        params = [user_id]
+
+        if start_date:
+            query += " AND expense_date >= %s"
+            params.append(start_date)
+
+        if end_date:
+            query += " AND expense_date <= %s"
+            params.append(end_date)
+
+        query += " ORDER BY amount DESC LIMIT %s"
+        params.append(int(limit))
+
+        result = db.execute_prepared(query, tuple(params))
+
+        if result:
+            return [Expense._from_row(data) for data in result]
+        return []
+
+    @staticmethod
+    @cached_query
+    def get_expense_stats(user_id, start_date=None, end_date=None):
+        """Get expense statistics"""
+        db = get_db()
+
+        # All-time stats are maintained incrementally in user_stats by the
+        # expense triggers, so the unfiltered path is an O(1) row read
+        # instead of an aggregate over the user's whole history
+        if not start_date and not end_date:
+            query = """
+                SELECT total,
+                       COALESCE(total / NULLIF(count, 0), 0) as average,
+                       max_amount as max_expense,
+                       min_amount as min_expense,
+                       count
+                FROM user_stats
+                WHERE user_id = %s
+            """
+            result = db.execute_prepared(query, (user_id,))
+            if result:
+                return result[0]
+            if result is not None:
+                # Table is live but the user has no expenses yet
+                return {'total': 0, 'average': 0, 'max_expense': 0,
+                        'min_expense': 0, 'count': 0}
+            # Stats table unavailable - fall through to the live aggregate
+
+        params = [user_id]
+        if start_date:
+            params.append(start_date)
+        if end_date:
+            params.append(end_date)
+
+        query = _EXPENSE_STATS_SQL[(bool(start_date), bool(end_date), False)]
+        result = db.execute_prepared(query, tuple(params))
         
         if result:
             return result[0]
@@ -263,22 +597,43 @@ class Expense:
     
     @staticmethod
     def search(user_id, search_term):
-        """Search expenses by description"""
+        """Search expenses by description or notes"""
         db = get_db()
-        
-        query = """
-            SELECT e.*, c.category_name, c.icon as category_icon, c.color as category_color
-            FROM expenses e
-            JOIN categories c ON e.category_id = c.category_id
-            WHERE e.user_id = %s AND (e.description LIKE %s OR e.notes LIKE %s)
-            ORDER BY e.expense_date DESC
-        """
-        
-        search_pattern = f"%{search_term}%"
-        result = db.execute_query(query, (user_id, search_pattern, search_pattern))
-        
+
+        term = (search_term or '').strip()
+        if not term:
+            return []
+
+        result = None
+
+        # Use the FULLTEXT index when the term is long enough to be indexed
+        # (InnoDB ignores tokens shorter than innodb_ft_min_token_size, 3 by
+        # default). Boolean-mode operators are stripped from user input and
+        # a trailing * gives prefix matching.
+        match_term = ''.join(ch for ch in term if ch not in '+-><()~*"@')
+        if len(match_term.strip()) >= 3:
+            query = """
+                SELECT *
+                FROM expenses
+                WHERE user_id = %s
+                  AND MATCH(description, notes) AGAINST (%s IN BOOLEAN MODE)
+                ORDER BY expense_date DESC
+            """
+            result = db.execute_prepared(query, (user_id, f"{match_term.strip()}*"))
+
+        if result is None:
+            # LIKE fallback - full scan of the user's rows, but always works
+            query = """
+                SELECT *
+                FROM expenses
+                WHERE user_id = %s AND (description LIKE %s OR notes LIKE %s)
+                ORDER BY expense_date DESC
+            """
+            search_pattern = f"%{term}%"
+            result = db.execute_prepared(query, (user_id, search_pattern, search_pattern))
+
         if result:
-            return [Expense(**data) for data in result]
+            return [Expense._from_row(data) for data in result]
         return []
     
     def update(self, category_id=None, amount=None, description=None,
@@ -325,27 +680,35 @@ class Expense:
         """
         
         result = db.execute_query(query, tuple(params), fetch=False)
+        if result is not None:
+            invalidate_user(self.user_id)
         return result is not None
-    
+
     def delete(self):
         """Delete expense"""
         db = get_db()
-        
+
         query = "DELETE FROM expenses WHERE expense_id = %s"
         result = db.execute_query(query, (self.expense_id,), fetch=False)
+        if result is not None:
+            invalidate_user(self.user_id)
         return result is not None
-    
+
     @staticmethod
     def delete_by_id(expense_id, user_id):
         """Delete expense by ID (with user verification)"""
         db = get_db()
-        
+
         query = "DELETE FROM expenses WHERE expense_id = %s AND user_id = %s"
         result = db.execute_query(query, (expense_id, user_id), fetch=False)
+        if result is not None:
+            invalidate_user(user_id)
         return result is not None
     
     def to_dict(self):
         """Convert expense to dictionary"""
+        # amount is already a float (see _from_row), so this is a single
+        # dict literal - called per row in the list/analytics views
         return {
             'expense_id': self.expense_id,
             'user_id': self.user_id,
@@ -353,7 +716,7 @@ class Expense:
             'category_name': self.category_name,
             'category_icon': self.category_icon,
             'category_color': self.category_color,
-            'amount': float(self.amount) if self.amount else 0,
+            'amount': self.amount or 0,
             'description': self.description,
             'expense_date': str(self.expense_date) if self.expense_date else None,
             'payment_method': self.payment_method,
@@ -364,7 +727,10 @@ class Expense:
 
 class Category:
     """Category model class"""
-    
+
+    __slots__ = ('category_id', 'category_name', 'name', 'icon',
+                 'color', 'description', 'is_default')
+
     def __init__(self, category_id=None, category_name=None, icon=None,
                  color=None, description=None, is_default=False, name=None, **kwargs):
         self.category_id = category_id
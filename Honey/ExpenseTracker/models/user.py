@@ -3,10 +3,6 @@ User Model
 Handles user-related database operations
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from database.db_connection import get_db
 from utils.helpers import hash_password, verify_password
 
@@ -124,19 +120,24 @@ class User:
     def exists(username=None, email=None):
         """Check if username or email already exists"""
         db = get_db()
-        
-        if username:
-            query = "SELECT COUNT(*) as count FROM users WHERE username = %s"
-            result = db.execute_query(query, (username,))
-            if result and result[0]['count'] > 0:
+
+        if not username and not email:
+            return False, None
+
+        # Single round-trip; EXISTS stops at the first matching index entry
+        # instead of counting every hit like COUNT(*)
+        query = """
+            SELECT EXISTS(SELECT 1 FROM users WHERE username = %s) as username_taken,
+                   EXISTS(SELECT 1 FROM users WHERE email = %s) as email_taken
+        """
+        result = db.execute_query(query, (username, email))
+
+        if result:
+            if username and result[0]['username_taken']:
                 return True, 'username'
-        
-        if email:
-            query = "SELECT COUNT(*) as count FROM users WHERE email = %s"
-            result = db.execute_query(query, (email,))
-            if result and result[0]['count'] > 0:
+            if email and result[0]['email_taken']:
                 return True, 'email'
-        
+
         return False, None
     
     def update(self, full_name=None, email=None):
@@ -171,22 +172,44 @@ class User:
     def change_password(self, old_password, new_password):
         """Change user password"""
         db = get_db()
-        
-        # Verify old password
-        query = "SELECT password FROM users WHERE user_id = %s"
-        result = db.execute_query(query, (self.user_id,))
-        
-        if not result or not verify_password(old_password, result[0]['password']):
-            return False, "Current password is incorrect"
-        
-        # Update password
-        new_hashed = hash_password(new_password)
-        update_query = "UPDATE users SET password = %s WHERE user_id = %s"
-        result = db.execute_query(update_query, (new_hashed, self.user_id), fetch=False)
-        
-        if result is not None:
+
+        # Verify and update on one connection inside a transaction - no pool
+        # round-trip between the two statements, and FOR UPDATE closes the
+        # race window between verifying the old hash and writing the new one
+        connection = db.get_connection()
+        if connection is None:
+            return False, "Failed to update password"
+
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            connection.start_transaction()
+
+            cursor.execute(
+                "SELECT password FROM users WHERE user_id = %s FOR UPDATE",
+                (self.user_id,)
+            )
+            row = cursor.fetchone()
+
+            if not row or not verify_password(old_password, row[0]):
+                connection.rollback()
+                return False, "Current password is incorrect"
+
+            new_hashed = hash_password(new_password)
+            cursor.execute(
+                "UPDATE users SET password = %s WHERE user_id = %s",
+                (new_hashed, self.user_id)
+            )
+            connection.commit()
             return True, "Password changed successfully"
-        return False, "Failed to update password"
+        except Exception as e:
+            connection.rollback()
+            print(f"Error changing password: {e}")
+            return False, "Failed to update password"
+        finally:
+            if cursor:
+                cursor.close()
+            connection.close()
     
     def to_dict(self):
         """Convert user to dictionary"""
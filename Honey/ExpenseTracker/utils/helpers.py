@@ -4,9 +4,11 @@ Common functions used throughout the application
 """
 
 import hashlib
+import hmac
 import re
 from datetime import datetime, date
 from decimal import Decimal
+from functools import lru_cache
 import csv
 import os
 
@@ -17,20 +19,30 @@ def hash_password(password):
 
 
 def verify_password(password, hashed):
-    """Verify password against hash"""
-    return hash_password(password) == hashed
+    """Verify password against hash (constant-time comparison)"""
+    return hmac.compare_digest(hash_password(password), hashed)
+
+
+# Validation patterns compiled once at import instead of per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]{3,20}$')
+_LETTER_RE = re.compile(r'[A-Za-z]')
+_DIGIT_RE = re.compile(r'\d')
 
 
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # Cheap checks first - most bad inputs fail before the regex runs
+    if not email or '@' not in email or len(email) > 254:
+        return False
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_username(username):
     """Validate username (alphanumeric, 3-20 chars)"""
-    pattern = r'^[a-zA-Z0-9_]{3,20}$'
-    return re.match(pattern, username) is not None
+    if not username or not 3 <= len(username) <= 20:
+        return False
+    return _USERNAME_RE.match(username) is not None
 
 
 def validate_password(password):
@@ -41,15 +53,16 @@ def validate_password(password):
     """
     if len(password) < 6:
         return False, "Password must be at least 6 characters"
-    if not re.search(r'[A-Za-z]', password):
+    if not _LETTER_RE.search(password):
         return False, "Password must contain at least one letter"
-    if not re.search(r'\d', password):
+    if not _DIGIT_RE.search(password):
         return False, "Password must contain at least one number"
     return True, "Password is valid"
 
 
+@lru_cache(maxsize=1024)
 def format_currency(amount, symbol='₹'):
-    """Format amount as currency"""
+    """Format amount as currency (memoized - amounts repeat across cards)"""
     if isinstance(amount, (int, float, Decimal)):
         return f"{symbol}{amount:,.2f}"
     return f"{symbol}0.00"
@@ -76,6 +89,7 @@ def get_current_month_year():
     return today.month, today.year
 
 
+@lru_cache(maxsize=32)
 def get_month_name(month_num):
     """Get month name from number"""
     months = [
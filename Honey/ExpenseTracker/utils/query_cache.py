@@ -0,0 +1,77 @@
+"""
+Query Cache
+Small in-process TTL cache for repeated dashboard aggregate queries
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+
+# Cache tuning - dashboard aggregates are cheap to hold and go stale quickly
+MAX_SIZE = 4096
+TTL_SECONDS = 60
+
+# key -> (expires_at, value), LRU order
+_cache = OrderedDict()
+# user_id -> set of cache keys, for targeted invalidation on writes
+_user_keys = {}
+_lock = threading.RLock()
+
+
+def cached_query(func):
+    """
+    Cache the result of an aggregate query for TTL_SECONDS.
+
+    The wrapped function must take user_id as its first argument so the
+    entry can be invalidated when that user's expenses change.
+    """
+    @wraps(func)
+    def wrapper(user_id, *args, **kwargs):
+        key = (func.__name__, user_id, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+
+        with _lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    _cache.move_to_end(key)
+                    return value
+                del _cache[key]
+
+        value = func(user_id, *args, **kwargs)
+
+        with _lock:
+            _cache[key] = (now + TTL_SECONDS, value)
+            _cache.move_to_end(key)
+            _user_keys.setdefault(user_id, set()).add(key)
+            while len(_cache) > MAX_SIZE:
+                old_key, _ = _cache.popitem(last=False)
+                keys = _user_keys.get(old_key[1])
+                if keys:
+                    keys.discard(old_key)
+
+        return value
+
+    return wrapper
+
+
+def invalidate_user(user_id):
+    """Drop all cached entries for a user (called after any expense write)"""
+    with _lock:
+        if user_id is None:
+            # Unknown owner - play safe and drop everything
+            _cache.clear()
+            _user_keys.clear()
+            return
+        for key in _user_keys.pop(user_id, ()):
+            _cache.pop(key, None)
+
+
+def clear():
+    """Drop the entire cache"""
+    with _lock:
+        _cache.clear()
+        _user_keys.clear()
@@ -83,6 +83,11 @@ COLORS = {
     'chart_8': '#FC8181',
 }
 
+def _hex_to_rgb(hex_color):
+    """Convert '#RRGGBB' to an (r, g, b) int tuple"""
+    return (int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16))
+
+
 # Category Colors - Vibrant palette
 CATEGORY_COLORS = {
     'Food & Dining': '#F56565',
@@ -99,6 +104,9 @@ CATEGORY_COLORS = {
     'Other': '#A0AEC0',
 }
 
+# RGB ints parsed once at import so drawing code never re-parses hex strings
+CATEGORY_COLORS_RGB = {name: _hex_to_rgb(color) for name, color in CATEGORY_COLORS.items()}
+
 # Chart color palette
 CHART_COLORS = [
     '#667EEA', '#48BB78', '#ED8936', '#F56565', 
@@ -291,14 +299,16 @@ ICONS = {
 # MENU ITEMS (Enhanced)
 # =============================================
 
-MENU_ITEMS = [
-    {'key': 'dashboard', 'label': 'Dashboard', 'icon': '🏠'},
-    {'key': 'expenses', 'label': 'Expenses', 'icon': '💳'},
-    {'key': 'add_expense', 'label': 'Add Expense', 'icon': '➕'},
-    {'key': 'budget', 'label': 'Budget', 'icon': '🎯'},
-    {'key': 'reports', 'label': 'Reports', 'icon': '📊'},
-    {'key': 'analytics', 'label': 'Analytics', 'icon': '📈'},
-]
+# (key, label, icon) tuples - iterated on every sidebar rebuild, so keep the
+# layout flat and unpack positionally instead of per-item dict lookups
+MENU_ITEMS = (
+    ('dashboard', 'Dashboard', '🏠'),
+    ('expenses', 'Expenses', '💳'),
+    ('add_expense', 'Add Expense', '➕'),
+    ('budget', 'Budget', '🎯'),
+    ('reports', 'Reports', '📊'),
+    ('analytics', 'Analytics', '📈'),
+)
 
 # =============================================
 # ANIMATION SETTINGS
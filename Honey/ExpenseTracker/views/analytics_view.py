@@ -3,30 +3,154 @@ Analytics View
 Advanced spending analytics with trends, predictions, and insights
 """
 
+import heapq
 import tkinter as tk
 from tkinter import ttk
-import sys
-import os
-from datetime import datetime, timedelta
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
 
 from utils.styles import COLORS, FONTS, CHART_COLORS
 from utils.helpers import format_currency, get_month_name
 
-# Try to import matplotlib
+# matplotlib is imported lazily: this is a navigated-to view and the TkAgg
+# backend costs hundreds of milliseconds cold, so app startup should not
+# pay for charts the user may never open
+_MPL = None
+_MPL_FAILED = False
+
+
+def _mpl():
+    """Import and cache the matplotlib pieces on first use (None if absent)"""
+    global _MPL, _MPL_FAILED
+    if _MPL is None and not _MPL_FAILED:
+        try:
+            import matplotlib
+            matplotlib.use('TkAgg')
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.ticker import FuncFormatter
+            _MPL = {'Figure': Figure, 'FigureCanvasTkAgg': FigureCanvasTkAgg,
+                    'FuncFormatter': FuncFormatter}
+        except ImportError:
+            _MPL_FAILED = True
+    return _MPL
+
+
+# Try to import numpy (ships with matplotlib) for vectorized aggregation
 try:
-    import matplotlib
-    matplotlib.use('TkAgg')
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
+    # Heatmap colour buckets: searchsorted maps intensity ratios onto the
+    # success/warning/error rungs in one call, no per-bar branching
+    _HEATMAP_EDGES = np.array([0.33, 0.66])
+    _HEATMAP_COLORS = np.array([COLORS['success'], COLORS['warning'],
+                                COLORS['error']])
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    NUMPY_AVAILABLE = False
 
 from controllers.expense_controller import ExpenseController
 
+# Worker pool for DB fetches so the Tk main loop never blocks on I/O
+_FETCH_POOL = ThreadPoolExecutor(max_workers=2)
+
+_STYLES_REGISTERED = False
+
+
+def _register_styles():
+    """
+    Register the named ttk label styles for the analytics cards (once).
+
+    A style name resolves the background/foreground/font options a single
+    time in Tcl, instead of each label construction passing and resolving
+    the same three keyword options again.
+    """
+    global _STYLES_REGISTERED
+    if _STYLES_REGISTERED:
+        return
+    style = ttk.Style()
+    # Labels sitting on a white card
+    style.configure('Card.TLabel', background=COLORS['card_bg'],
+                    foreground=COLORS['text_secondary'], font=FONTS['body'])
+    style.configure('Card.Value.TLabel', background=COLORS['card_bg'],
+                    foreground=COLORS['text_primary'],
+                    font=FONTS['heading_small'])
+    # Labels sitting on the grey inner tiles (patterns/recommendations)
+    style.configure('Tile.TLabel', background=COLORS['bg_secondary'],
+                    foreground=COLORS['text_secondary'], font=FONTS['caption'])
+    style.configure('Tile.Icon.TLabel', background=COLORS['bg_secondary'],
+                    font=FONTS['heading_small'])
+    style.configure('Tile.Title.TLabel', background=COLORS['bg_secondary'],
+                    foreground=COLORS['text_primary'],
+                    font=FONTS['body_medium'])
+    style.configure('Tile.Value.TLabel', background=COLORS['bg_secondary'],
+                    foreground=COLORS['primary'], font=FONTS['heading_small'])
+    style.configure('Tile.Body.TLabel', background=COLORS['bg_secondary'],
+                    foreground=COLORS['text_secondary'], font=FONTS['body'])
+    style.configure('Tile.Action.TLabel', background=COLORS['bg_secondary'],
+                    foreground=COLORS['primary'], font=FONTS['body_small'])
+    _STYLES_REGISTERED = True
+
+
+class _BlitBars:
+    """
+    Blit helper for bar charts whose layout is stable between refreshes.
+
+    After a full draw the axes background (spines, ticks, labels) is
+    cached; when only the bar heights change, the background is restored
+    and just the bar/label artists are re-drawn and blitted - an order of
+    magnitude cheaper than recompositing the whole axes.
+    """
+
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+        self.bars = None
+        self.labels = None
+        self._background = None
+        # Any full draw (first render, resize, layout change) recaptures
+        # the background and re-draws the animated artists over it
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        if self.bars is not None:
+            for bar in self.bars:
+                self.ax.draw_artist(bar)
+        if self.labels is not None:
+            for label in self.labels:
+                self.ax.draw_artist(label)
+
+    def set_artists(self, bars, labels=None):
+        """Adopt freshly created artists (they must be animated=True)"""
+        self.bars = bars
+        self.labels = labels
+
+    def can_update(self, values):
+        """True when the new values fit the cached background"""
+        return (self.bars is not None
+                and self._background is not None
+                and len(self.bars) == len(values)
+                and (max(values) if values else 0) <= self.ax.get_ylim()[1])
+
+    def update(self, values, colors=None, label_texts=None):
+        """Redraw only the bars (and labels) over the cached background"""
+        self.canvas.restore_region(self._background)
+        for i, bar in enumerate(self.bars):
+            bar.set_height(values[i])
+            if colors is not None:
+                bar.set_facecolor(colors[i])
+        if self.labels is not None and label_texts is not None:
+            for label, bar, text in zip(self.labels, self.bars, label_texts):
+                label.set_text(text)
+                # bar_label annotations anchor at (bar centre, bar top)
+                label.xy = (bar.get_x() + bar.get_width() / 2,
+                            bar.get_height())
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+
 
 class AnalyticsView(tk.Frame):
     """Advanced analytics and insights view"""
@@ -36,12 +160,30 @@ class AnalyticsView(tk.Frame):
         self.parent = parent
         self.user = user
         self.on_navigate = on_navigate
-        
+
+        # Chart cards are built once and reused across refreshes -
+        # (fig, ax, canvas) triples, populated lazily on first render
+        self._heatmap_chart = None
+        self._pie_chart = None
+        self._comparison_chart = None
+        self._heatmap_blit = None
+        self._comparison_blit = None
+
+        # Widget pools - card skeletons are built on first render and
+        # refreshed with label.config() instead of destroy/recreate
+        self._insight_labels = None
+        self._pattern_value_labels = None
+        self._top_expense_rows = None
+        self._top_empty_label = None
+        self._loading_label = None
+
         self.create_widgets()
         self.load_data()
     
     def create_widgets(self):
         """Create analytics widgets"""
+        _register_styles()
+
         # Main scrollable container
         canvas = tk.Canvas(self, bg=COLORS['bg_secondary'], highlightthickness=0)
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
@@ -58,10 +200,16 @@ class AnalyticsView(tk.Frame):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Bind mouse wheel
+        # Bind mouse wheel only while the pointer is over this view, so the
+        # global binding does not leak into (or fire events for) other views
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        # <Leave> never fires when the view is destroyed under the
+        # pointer (e.g. a recommendation navigates away) - drop the
+        # global handler then too
+        canvas.bind("<Destroy>", lambda e: canvas.unbind_all("<MouseWheel>"))
         
         # Content
         content = tk.Frame(self.scrollable_frame, bg=COLORS['bg_secondary'])
@@ -129,14 +277,6 @@ class AnalyticsView(tk.Frame):
     
     def create_insights_cards(self, data):
         """Create insight summary cards"""
-        # Clear existing
-        for widget in self.insights_frame.winfo_children():
-            widget.destroy()
-        
-        # Configure grid
-        for i in range(4):
-            self.insights_frame.columnconfigure(i, weight=1)
-        
         insights = [
             {
                 'icon': '📊',
@@ -169,23 +309,43 @@ class AnalyticsView(tk.Frame):
                 'color': COLORS['success']
             }
         ]
-        
-        for i, insight in enumerate(insights):
-            self.create_insight_card(i, insight)
-    
+
+        if self._insight_labels is None:
+            # First render - build the card skeletons once
+            for i in range(4):
+                self.insights_frame.columnconfigure(i, weight=1)
+            self._insight_labels = [self.create_insight_card(i, insight)
+                                    for i, insight in enumerate(insights)]
+        else:
+            # Warm refresh - update label text in place, no Tk churn
+            for labels, insight in zip(self._insight_labels, insights):
+                value_label, extra_label = labels
+                value_label.config(text=insight['value'])
+                self._config_insight_extra(extra_label, insight)
+
+    @staticmethod
+    def _config_insight_extra(label, data):
+        """Set an insight card's change/subtitle line from its data"""
+        if 'change' in data:
+            change_color = COLORS['success'] if data.get('positive') else COLORS['error']
+            arrow = '↑' if data.get('positive') else '↓'
+            label.config(text=f"{arrow} {data['change']}", fg=change_color)
+        else:
+            label.config(text=data.get('subtitle', ''), fg=COLORS['text_secondary'])
+
     def create_insight_card(self, col, data):
-        """Create individual insight card"""
+        """Create individual insight card; returns its mutable labels"""
         card = tk.Frame(self.insights_frame, bg=COLORS['card_bg'])
         card.grid(row=0, column=col, sticky='nsew', padx=8, pady=5)
-        
+
         inner = tk.Frame(card, bg=COLORS['card_bg'])
         inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
+
         # Icon
         icon_frame = tk.Frame(inner, bg=data['color'], width=45, height=45)
         icon_frame.pack(anchor='w')
         icon_frame.pack_propagate(False)
-        
+
         tk.Label(
             icon_frame,
             text=data['icon'],
@@ -193,106 +353,138 @@ class AnalyticsView(tk.Frame):
             bg=data['color'],
             fg=COLORS['text_white']
         ).place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        
+
         # Title
-        tk.Label(
-            inner,
-            text=data['title'],
-            font=FONTS['body'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_secondary']
-        ).pack(anchor='w', pady=(12, 3))
-        
+        ttk.Label(inner, text=data['title'],
+                  style='Card.TLabel').pack(anchor='w', pady=(12, 3))
+
         # Value
-        tk.Label(
-            inner,
-            text=data['value'],
-            font=FONTS['heading_small'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
-        ).pack(anchor='w')
-        
+        value_label = ttk.Label(inner, text=data['value'],
+                                style='Card.Value.TLabel')
+        value_label.pack(anchor='w')
+
         # Change/Subtitle
-        if 'change' in data:
-            change_color = COLORS['success'] if data.get('positive') else COLORS['error']
-            arrow = '↑' if data.get('positive') else '↓'
-            tk.Label(
-                inner,
-                text=f"{arrow} {data['change']}",
-                font=FONTS['body_small'],
-                bg=COLORS['card_bg'],
-                fg=change_color
-            ).pack(anchor='w', pady=(5, 0))
-        elif 'subtitle' in data:
-            tk.Label(
-                inner,
-                text=data['subtitle'],
-                font=FONTS['body_small'],
-                bg=COLORS['card_bg'],
-                fg=COLORS['text_secondary']
-            ).pack(anchor='w', pady=(5, 0))
+        extra_label = tk.Label(
+            inner,
+            font=FONTS['body_small'],
+            bg=COLORS['card_bg']
+        )
+        extra_label.pack(anchor='w', pady=(5, 0))
+        self._config_insight_extra(extra_label, data)
+
+        return value_label, extra_label
     
-    def create_spending_heatmap(self, daily_data):
-        """Create spending heatmap by day of week"""
-        # Clear existing
-        for widget in self.heatmap_frame.winfo_children():
+    def _make_card(self, parent, title):
+        """Clear a card frame and rebuild its header; returns the inner frame"""
+        for widget in parent.winfo_children():
             widget.destroy()
-        
-        inner = tk.Frame(self.heatmap_frame, bg=COLORS['card_bg'])
+
+        inner = tk.Frame(parent, bg=COLORS['card_bg'])
         inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
+
         tk.Label(
             inner,
-            text="🗓️ Spending by Day of Week",
+            text=title,
             font=FONTS['subheading'],
             bg=COLORS['card_bg'],
             fg=COLORS['text_primary']
         ).pack(anchor='w', pady=(0, 15))
-        
-        # Process data by day of week
-        day_totals = {i: 0 for i in range(7)}
-        day_counts = {i: 0 for i in range(7)}
-        
-        for d in daily_data:
-            try:
-                date = datetime.strptime(d['date'], '%Y-%m-%d')
-                day_of_week = date.weekday()
-                day_totals[day_of_week] += float(d['total'])
-                day_counts[day_of_week] += 1
-            except:
-                pass
-        
-        # Calculate averages
-        day_avgs = {k: (v / day_counts[k] if day_counts[k] > 0 else 0) for k, v in day_totals.items()}
+
+        return inner
+
+    def _make_chart(self, parent, title, figsize, fill=tk.X):
+        """
+        Build a chart card once: header label, Figure, Axes, Tk canvas.
+
+        Refreshes reuse the returned (fig, ax, canvas) triple and just
+        ax.clear() + draw_idle(), instead of tearing down the Tk widget
+        and reallocating backend buffers on every load.
+        """
+        inner = self._make_card(parent, title)
+
+        mpl = _mpl()
+        # 72 dpi halves the pixel count of the default 100 - these are
+        # small in-card charts, so Agg compositing cost matters more than
+        # print-quality rasterization
+        fig = mpl['Figure'](figsize=figsize, dpi=72, facecolor=COLORS['card_bg'])
+        ax = fig.add_subplot(111)
+        canvas = mpl['FigureCanvasTkAgg'](fig, inner)
+        if fill:
+            canvas.get_tk_widget().pack(fill=fill)
+        else:
+            canvas.get_tk_widget().pack()
+
+        return fig, ax, canvas
+
+    def _style_axes(self, ax, labelsize=None):
+        """Apply the shared card styling to a bar chart's axes"""
+        ax.set_facecolor(COLORS['card_bg'])
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_color(COLORS['border'])
+        ax.spines['bottom'].set_color(COLORS['border'])
+        if labelsize:
+            ax.tick_params(colors=COLORS['text_secondary'], labelsize=labelsize)
+        else:
+            ax.tick_params(colors=COLORS['text_secondary'])
+
+    def create_spending_heatmap(self, dow_data, daily_data=None):
+        """Create spending heatmap by day of week"""
+        # Preferred source: the GROUP BY WEEKDAY rows computed by the DB.
+        # Aggregate daily rows in Python only if that query came back empty.
+        if dow_data:
+            day_avgs = {i: 0 for i in range(7)}
+            for row in dow_data:
+                days = row.get('days') or 0
+                if days:
+                    day_avgs[int(row['dow'])] = float(row['total']) / days
+        else:
+            day_avgs = self.aggregate_by_weekday(daily_data or [])
+
         max_avg = max(day_avgs.values()) if day_avgs else 1
-        
+
         days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        
-        if MATPLOTLIB_AVAILABLE:
-            fig = Figure(figsize=(5, 3), dpi=100, facecolor=COLORS['card_bg'])
-            ax = fig.add_subplot(111)
-            
+
+        mpl = _mpl()
+        if mpl:
+            if self._heatmap_chart is None:
+                self._heatmap_chart = self._make_chart(
+                    self.heatmap_frame, "🗓️ Spending by Day of Week",
+                    figsize=(5, 3))
+            fig, ax, canvas = self._heatmap_chart
+            if self._heatmap_blit is None:
+                self._heatmap_blit = _BlitBars(canvas, ax)
+
             values = [day_avgs[i] for i in range(7)]
-            colors = [self.get_heatmap_color(v, max_avg) for v in values]
-            
-            bars = ax.bar(days, values, color=colors, width=0.6, edgecolor='white')
-            
-            ax.set_facecolor(COLORS['card_bg'])
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(COLORS['border'])
-            ax.spines['bottom'].set_color(COLORS['border'])
-            ax.tick_params(colors=COLORS['text_secondary'], labelsize=9)
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(
-                lambda x, p: f'₹{x/1000:.0f}k' if x >= 1000 else f'₹{x:.0f}'))
-            
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, inner)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.X)
+            if NUMPY_AVAILABLE and max_avg > 0:
+                ratios = np.array(values) / max_avg
+                # side='right' keeps the original < boundaries exact
+                buckets = np.searchsorted(_HEATMAP_EDGES, ratios, side='right')
+                colors = _HEATMAP_COLORS[buckets].tolist()
+            else:
+                colors = [self.get_heatmap_color(v, max_avg) for v in values]
+
+            if self._heatmap_blit.can_update(values):
+                # Only bar heights/colors changed - blit over the cached
+                # axes background instead of a full redraw
+                self._heatmap_blit.update(values, colors=colors)
+            else:
+                ax.clear()
+                bars = ax.bar(days, values, color=colors, width=0.6,
+                              edgecolor='white', animated=True)
+
+                self._style_axes(ax, labelsize=9)
+                ax.yaxis.set_major_formatter(mpl['FuncFormatter'](
+                    lambda x, p: f'₹{x/1000:.0f}k' if x >= 1000 else f'₹{x:.0f}'))
+                # Headroom so moderately larger values can still blit later
+                ax.set_ylim(0, max(max(values) * 1.25, 1))
+
+                fig.tight_layout()
+                self._heatmap_blit.set_artists(bars)
+                canvas.draw()
         else:
             # Text fallback
+            inner = self._make_card(self.heatmap_frame, "🗓️ Spending by Day of Week")
             for i, day in enumerate(days):
                 row = tk.Frame(inner, bg=COLORS['card_bg'])
                 row.pack(fill=tk.X, pady=3)
@@ -319,6 +511,40 @@ class AnalyticsView(tk.Frame):
                     fg=COLORS['text_secondary']
                 ).pack(side=tk.LEFT, padx=5)
     
+    @staticmethod
+    def aggregate_by_weekday(daily_data):
+        """Average spending per weekday (Mon=0) from daily total rows"""
+        rows = [d for d in daily_data if d.get('date')]
+
+        if NUMPY_AVAILABLE and rows:
+            # One vectorized pass instead of a strptime call per row:
+            # datetime64[D] is days since the epoch, and 1970-01-01 was a
+            # Thursday, so +3 maps day numbers onto Monday=0 weekdays
+            dates = np.array([str(d['date']) for d in rows], dtype='datetime64[D]')
+            totals = np.fromiter((float(d['total']) for d in rows),
+                                 dtype=np.float64, count=len(rows))
+            weekdays = (dates.view('int64') + 3) % 7
+            sums = np.bincount(weekdays, weights=totals, minlength=7)
+            counts = np.bincount(weekdays, minlength=7)
+            avgs = np.divide(sums, counts, out=np.zeros(7), where=counts > 0)
+            return {i: float(avgs[i]) for i in range(7)}
+
+        day_totals = {i: 0 for i in range(7)}
+        day_counts = {i: 0 for i in range(7)}
+
+        for d in rows:
+            try:
+                # fromisoformat is the C fast path; strptime re-runs the
+                # format-directive machinery on every call
+                day_of_week = date.fromisoformat(str(d['date'])).weekday()
+                day_totals[day_of_week] += float(d['total'])
+                day_counts[day_of_week] += 1
+            except (ValueError, KeyError, TypeError):
+                continue
+
+        return {k: (v / day_counts[k] if day_counts[k] > 0 else 0)
+                for k, v in day_totals.items()}
+
     def get_heatmap_color(self, value, max_value):
         """Get color based on value intensity"""
         if max_value == 0:
@@ -334,33 +560,35 @@ class AnalyticsView(tk.Frame):
     
     def create_category_breakdown(self, categories):
         """Create category distribution chart"""
-        # Clear existing
-        for widget in self.radar_frame.winfo_children():
-            widget.destroy()
-        
-        inner = tk.Frame(self.radar_frame, bg=COLORS['card_bg'])
-        inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        tk.Label(
-            inner,
-            text="🥧 Category Distribution",
-            font=FONTS['subheading'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
-        ).pack(anchor='w', pady=(0, 15))
-        
-        if MATPLOTLIB_AVAILABLE and categories:
-            data = [(c['category_name'].split(' ')[-1][:10], float(c['total']), c.get('color', CHART_COLORS[0])) 
-                    for c in categories if float(c['total']) > 0][:6]
-            
-            if data:
-                fig = Figure(figsize=(4.5, 3.5), dpi=100, facecolor=COLORS['card_bg'])
-                ax = fig.add_subplot(111)
-                
+        mpl = _mpl()
+        if mpl and categories:
+            if NUMPY_AVAILABLE:
+                # One totals array instead of two float() calls per row;
+                # argsort keeps the six largest slices
+                totals = np.fromiter((float(c['total']) for c in categories),
+                                     dtype=np.float64, count=len(categories))
+                order = [int(i) for i in np.argsort(-totals)[:6] if totals[i] > 0]
+                labels = [categories[i]['category_name'].rsplit(' ', 1)[-1][:10]
+                          for i in order]
+                sizes = [float(totals[i]) for i in order]
+                colors = [categories[i].get('color', CHART_COLORS[0]) for i in order]
+            else:
+                data = [(c['category_name'].split(' ')[-1][:10], float(c['total']), c.get('color', CHART_COLORS[0]))
+                        for c in categories if float(c['total']) > 0][:6]
                 labels = [d[0] for d in data]
                 sizes = [d[1] for d in data]
                 colors = [d[2] for d in data]
-                
+
+            if sizes:
+                if self._pie_chart is None:
+                    self._pie_chart = self._make_chart(
+                        self.radar_frame, "🥧 Category Distribution",
+                        figsize=(4.5, 3.5), fill=None)
+                fig, ax, canvas = self._pie_chart
+
+                ax.clear()
+                # wedgeprops width turns the pie into a donut directly -
+                # no covering Circle patch to composite on every draw
                 wedges, texts, autotexts = ax.pie(
                     sizes,
                     labels=labels,
@@ -368,171 +596,176 @@ class AnalyticsView(tk.Frame):
                     autopct='%1.0f%%',
                     startangle=90,
                     textprops={'fontsize': 8},
-                    pctdistance=0.75
+                    pctdistance=0.75,
+                    wedgeprops={'width': 0.5, 'edgecolor': COLORS['card_bg']}
                 )
-                
+
                 for autotext in autotexts:
                     autotext.set_color('white')
                     autotext.set_fontsize(7)
-                
-                # Draw center circle for donut
-                centre_circle = plt.Circle((0, 0), 0.50, fc=COLORS['card_bg'])
-                ax.add_patch(centre_circle)
-                
+
                 ax.axis('equal')
                 fig.tight_layout()
-                
-                canvas = FigureCanvasTkAgg(fig, inner)
-                canvas.draw()
-                canvas.get_tk_widget().pack()
-            else:
-                self.show_no_data(inner)
+                canvas.draw_idle()
+                return
+
+        # No data (or no matplotlib) - blank the cached chart if one
+        # exists, otherwise fall back to the plain card
+        if self._pie_chart is not None:
+            fig, ax, canvas = self._pie_chart
+            ax.clear()
+            ax.axis('off')
+            canvas.draw_idle()
         else:
+            inner = self._make_card(self.radar_frame, "🥧 Category Distribution")
             self.show_no_data(inner)
     
-    def create_monthly_comparison(self, monthly_data):
+    def create_monthly_comparison(self, monthly_data, totals=None):
         """Create monthly spending comparison"""
-        # Clear existing
-        for widget in self.comparison_frame.winfo_children():
-            widget.destroy()
-        
-        inner = tk.Frame(self.comparison_frame, bg=COLORS['card_bg'])
-        inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        tk.Label(
-            inner,
-            text="📊 Monthly Comparison",
-            font=FONTS['subheading'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
-        ).pack(anchor='w', pady=(0, 15))
-        
-        if MATPLOTLIB_AVAILABLE and monthly_data:
-            fig = Figure(figsize=(5, 3.5), dpi=100, facecolor=COLORS['card_bg'])
-            ax = fig.add_subplot(111)
-            
+        if _mpl() and monthly_data:
+            if self._comparison_chart is None:
+                self._comparison_chart = self._make_chart(
+                    self.comparison_frame, "📊 Monthly Comparison",
+                    figsize=(5, 3.5))
+            fig, ax, canvas = self._comparison_chart
+            if self._comparison_blit is None:
+                self._comparison_blit = _BlitBars(canvas, ax)
+
             months = [get_month_name(d['month'])[:3] for d in monthly_data]
-            values = [float(d['total']) for d in monthly_data]
-            
-            # Create gradient effect with colors
-            colors = [COLORS['primary_light'] if i < len(values)-1 else COLORS['primary'] 
-                      for i in range(len(values))]
-            
-            bars = ax.bar(range(len(months)), values, color=colors, width=0.6, edgecolor='white')
-            
-            # Add value labels
-            for bar, val in zip(bars, values):
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'₹{val/1000:.0f}k' if val >= 1000 else f'₹{val:.0f}',
-                       ha='center', va='bottom', fontsize=7, color=COLORS['text_secondary'])
-            
-            ax.set_xticks(range(len(months)))
-            ax.set_xticklabels(months, fontsize=8)
-            ax.set_facecolor(COLORS['card_bg'])
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(COLORS['border'])
-            ax.spines['bottom'].set_color(COLORS['border'])
-            ax.tick_params(colors=COLORS['text_secondary'])
-            
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, inner)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.X)
+            # Reuse the totals array already built in _apply_data
+            if totals is not None:
+                values = totals.tolist()
+            else:
+                values = [float(d['total']) for d in monthly_data]
+            label_texts = [f'₹{v/1000:.0f}k' if v >= 1000 else f'₹{v:.0f}'
+                           for v in values]
+
+            if self._comparison_blit.can_update(values):
+                # Only bar heights/labels changed - blit them over the
+                # cached axes background
+                self._comparison_blit.update(values, label_texts=label_texts)
+            else:
+                # Create gradient effect with colors
+                colors = [COLORS['primary_light'] if i < len(values)-1 else COLORS['primary']
+                          for i in range(len(values))]
+
+                ax.clear()
+                bars = ax.bar(range(len(months)), values, color=colors,
+                              width=0.6, edgecolor='white', animated=True)
+
+                # Add value labels - bar_label positions them in one call
+                labels = ax.bar_label(bars, labels=label_texts, padding=2,
+                                      fontsize=7,
+                                      color=COLORS['text_secondary'],
+                                      animated=True)
+
+                ax.set_xticks(range(len(months)))
+                ax.set_xticklabels(months, fontsize=8)
+                self._style_axes(ax)
+                # Headroom so moderately larger values can still blit later
+                ax.set_ylim(0, max(max(values) * 1.25, 1))
+
+                fig.tight_layout()
+                self._comparison_blit.set_artists(bars, labels)
+                canvas.draw()
+        elif self._comparison_chart is not None:
+            fig, ax, canvas = self._comparison_chart
+            ax.clear()
+            ax.axis('off')
+            canvas.draw_idle()
         else:
+            inner = self._make_card(self.comparison_frame, "📊 Monthly Comparison")
             self.show_no_data(inner)
     
     def create_top_expenses(self, expenses):
         """Create top expenses list"""
-        # Clear existing
-        for widget in self.top_expenses_frame.winfo_children():
-            widget.destroy()
-        
-        inner = tk.Frame(self.top_expenses_frame, bg=COLORS['card_bg'])
-        inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
+        if self._top_expense_rows is None:
+            # First render - build a fixed pool of 5 reusable rows
+            inner = self._make_card(self.top_expenses_frame, "🔝 Highest Expenses")
+            self._top_expense_rows = [self._build_top_expense_row(inner, i)
+                                      for i in range(5)]
+            self._top_empty_label = tk.Label(
+                inner,
+                text="📭 No data available",
+                font=FONTS['body'],
+                bg=COLORS['card_bg'],
+                fg=COLORS['text_secondary']
+            )
+
+        # Top 5 by amount - nlargest is O(n) instead of a full sort
+        sorted_expenses = heapq.nlargest(5, expenses, key=lambda x: float(x.amount))
+
+        for i, slot in enumerate(self._top_expense_rows):
+            if i < len(sorted_expenses):
+                expense = sorted_expenses[i]
+                slot['desc'].config(text=(expense.description or "No description")[:25])
+                slot['date'].config(text=str(expense.expense_date or ""))
+                slot['amount'].config(text=format_currency(expense.amount))
+                if not slot['row'].winfo_manager():
+                    slot['row'].pack(fill=tk.X, pady=8)
+            else:
+                slot['row'].pack_forget()
+
+        if sorted_expenses:
+            self._top_empty_label.pack_forget()
+        else:
+            self._top_empty_label.pack(pady=30)
+
+    def _build_top_expense_row(self, parent, i):
+        """Build one reusable top-expense row; returns its mutable labels"""
+        row = tk.Frame(parent, bg=COLORS['card_bg'])
+        row.pack(fill=tk.X, pady=8)
+
+        # Rank
+        rank_colors = ['#FFD700', '#C0C0C0', '#CD7F32', COLORS['text_light'], COLORS['text_light']]
+        rank_frame = tk.Frame(row, bg=rank_colors[i], width=28, height=28)
+        rank_frame.pack(side=tk.LEFT)
+        rank_frame.pack_propagate(False)
+
         tk.Label(
-            inner,
-            text="🔝 Highest Expenses",
-            font=FONTS['subheading'],
+            rank_frame,
+            text=str(i + 1),
+            font=FONTS['body_medium'],
+            bg=rank_colors[i],
+            fg=COLORS['text_white'] if i < 3 else COLORS['text_primary']
+        ).place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+
+        # Info
+        info = tk.Frame(row, bg=COLORS['card_bg'])
+        info.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0))
+
+        desc_label = tk.Label(
+            info,
+            font=FONTS['body_medium'],
             bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
-        ).pack(anchor='w', pady=(0, 15))
-        
-        if expenses:
-            # Sort by amount
-            sorted_expenses = sorted(expenses, key=lambda x: float(x.amount), reverse=True)[:5]
-            
-            for i, expense in enumerate(sorted_expenses):
-                row = tk.Frame(inner, bg=COLORS['card_bg'])
-                row.pack(fill=tk.X, pady=8)
-                
-                # Rank
-                rank_colors = ['#FFD700', '#C0C0C0', '#CD7F32', COLORS['text_light'], COLORS['text_light']]
-                rank_frame = tk.Frame(row, bg=rank_colors[i], width=28, height=28)
-                rank_frame.pack(side=tk.LEFT)
-                rank_frame.pack_propagate(False)
-                
-                tk.Label(
-                    rank_frame,
-                    text=str(i + 1),
-                    font=FONTS['body_medium'],
-                    bg=rank_colors[i],
-                    fg=COLORS['text_white'] if i < 3 else COLORS['text_primary']
-                ).place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-                
-                # Info
-                info = tk.Frame(row, bg=COLORS['card_bg'])
-                info.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0))
-                
-                tk.Label(
-                    info,
-                    text=(expense.description or "No description")[:25],
-                    font=FONTS['body_medium'],
-                    bg=COLORS['card_bg'],
-                    fg=COLORS['text_primary'],
-                    anchor='w'
-                ).pack(anchor='w')
-                
-                tk.Label(
-                    info,
-                    text=expense.expense_date or "",
-                    font=FONTS['caption'],
-                    bg=COLORS['card_bg'],
-                    fg=COLORS['text_light'],
-                    anchor='w'
-                ).pack(anchor='w')
-                
-                # Amount
-                tk.Label(
-                    row,
-                    text=format_currency(expense.amount),
-                    font=FONTS['body_medium'],
-                    bg=COLORS['card_bg'],
-                    fg=COLORS['error']
-                ).pack(side=tk.RIGHT)
-        else:
-            self.show_no_data(inner)
+            fg=COLORS['text_primary'],
+            anchor='w'
+        )
+        desc_label.pack(anchor='w')
+
+        date_label = tk.Label(
+            info,
+            font=FONTS['caption'],
+            bg=COLORS['card_bg'],
+            fg=COLORS['text_light'],
+            anchor='w'
+        )
+        date_label.pack(anchor='w')
+
+        # Amount
+        amount_label = tk.Label(
+            row,
+            font=FONTS['body_medium'],
+            bg=COLORS['card_bg'],
+            fg=COLORS['error']
+        )
+        amount_label.pack(side=tk.RIGHT)
+
+        return {'row': row, 'desc': desc_label, 'date': date_label,
+                'amount': amount_label}
     
     def create_spending_patterns(self, data):
         """Create spending patterns analysis"""
-        # Clear existing
-        for widget in self.patterns_frame.winfo_children():
-            widget.destroy()
-        
-        inner = tk.Frame(self.patterns_frame, bg=COLORS['card_bg'])
-        inner.pack(fill=tk.X, padx=25, pady=20)
-        
-        tk.Label(
-            inner,
-            text="🔍 Spending Patterns & Insights",
-            font=FONTS['subheading'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
-        ).pack(anchor='w', pady=(0, 15))
-        
         patterns = [
             {
                 'icon': '📅',
@@ -560,49 +793,50 @@ class AnalyticsView(tk.Frame):
             }
         ]
         
+        if self._pattern_value_labels is not None:
+            # Warm refresh - only the values change
+            for label, pattern in zip(self._pattern_value_labels, patterns):
+                label.config(text=pattern['value'])
+            return
+
+        inner = tk.Frame(self.patterns_frame, bg=COLORS['card_bg'])
+        inner.pack(fill=tk.X, padx=25, pady=20)
+
+        tk.Label(
+            inner,
+            text="🔍 Spending Patterns & Insights",
+            font=FONTS['subheading'],
+            bg=COLORS['card_bg'],
+            fg=COLORS['text_primary']
+        ).pack(anchor='w', pady=(0, 15))
+
         patterns_row = tk.Frame(inner, bg=COLORS['card_bg'])
         patterns_row.pack(fill=tk.X)
-        
+
+        self._pattern_value_labels = []
         for pattern in patterns:
             card = tk.Frame(patterns_row, bg=COLORS['bg_secondary'])
             card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-            
+
             card_inner = tk.Frame(card, bg=COLORS['bg_secondary'])
             card_inner.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-            
+
             header = tk.Frame(card_inner, bg=COLORS['bg_secondary'])
             header.pack(fill=tk.X)
-            
-            tk.Label(
-                header,
-                text=pattern['icon'],
-                font=FONTS['heading_small'],
-                bg=COLORS['bg_secondary']
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                header,
-                text=pattern['title'],
-                font=FONTS['body_medium'],
-                bg=COLORS['bg_secondary'],
-                fg=COLORS['text_primary']
-            ).pack(side=tk.LEFT, padx=(8, 0))
-            
-            tk.Label(
-                card_inner,
-                text=pattern['value'],
-                font=FONTS['heading_small'],
-                bg=COLORS['bg_secondary'],
-                fg=COLORS['primary']
-            ).pack(anchor='w', pady=(10, 3))
-            
-            tk.Label(
-                card_inner,
-                text=pattern['description'],
-                font=FONTS['caption'],
-                bg=COLORS['bg_secondary'],
-                fg=COLORS['text_secondary']
-            ).pack(anchor='w')
+
+            ttk.Label(header, text=pattern['icon'],
+                      style='Tile.Icon.TLabel').pack(side=tk.LEFT)
+
+            ttk.Label(header, text=pattern['title'],
+                      style='Tile.Title.TLabel').pack(side=tk.LEFT, padx=(8, 0))
+
+            value_label = ttk.Label(card_inner, text=pattern['value'],
+                                    style='Tile.Value.TLabel')
+            value_label.pack(anchor='w', pady=(10, 3))
+            self._pattern_value_labels.append(value_label)
+
+            ttk.Label(card_inner, text=pattern['description'],
+                      style='Tile.TLabel').pack(anchor='w')
     
     def create_recommendations(self, data):
         """Create spending recommendations"""
@@ -674,34 +908,16 @@ class AnalyticsView(tk.Frame):
         title_row = tk.Frame(content, bg=COLORS['bg_secondary'])
         title_row.pack(fill=tk.X)
         
-        tk.Label(
-            title_row,
-            text=f"{icon} {rec['title']}",
-            font=FONTS['body_medium'],
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['text_primary']
-        ).pack(side=tk.LEFT)
-        
-        tk.Label(
-            content,
-            text=rec['message'],
-            font=FONTS['body'],
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['text_secondary'],
-            wraplength=600,
-            justify='left'
-        ).pack(anchor='w', pady=(5, 0))
-        
+        ttk.Label(title_row, text=f"{icon} {rec['title']}",
+                  style='Tile.Title.TLabel').pack(side=tk.LEFT)
+
+        ttk.Label(content, text=rec['message'], style='Tile.Body.TLabel',
+                  wraplength=600, justify='left').pack(anchor='w', pady=(5, 0))
+
         # Action button
         if rec.get('action'):
-            action_btn = tk.Label(
-                content,
-                text=f"→ {rec['action']}",
-                font=FONTS['body_small'],
-                bg=COLORS['bg_secondary'],
-                fg=COLORS['primary'],
-                cursor='hand2'
-            )
+            action_btn = ttk.Label(content, text=f"→ {rec['action']}",
+                                   style='Tile.Action.TLabel', cursor='hand2')
             action_btn.pack(anchor='w', pady=(8, 0))
             action_btn.bind('<Button-1>', lambda e, a=rec['action']: self.handle_action(a))
     
@@ -721,35 +937,106 @@ class AnalyticsView(tk.Frame):
         ).pack(pady=30)
     
     def load_data(self):
-        """Load analytics data"""
-        # Get report data
+        """Load analytics data on a worker thread, then build the UI"""
+        if self._insight_labels is None and self._loading_label is None:
+            self._loading_label = tk.Label(
+                self.insights_frame,
+                text="⏳ Loading analytics...",
+                font=FONTS['body'],
+                bg=COLORS['bg_secondary'],
+                fg=COLORS['text_secondary']
+            )
+            self._loading_label.pack(pady=20)
+
+        future = _FETCH_POOL.submit(self._fetch_data)
+        future.add_done_callback(self._on_data_ready)
+
+    def _fetch_data(self):
+        """Runs on a worker thread - DB access only, no widget calls"""
         today = datetime.now()
         start_date = (today - timedelta(days=90)).strftime('%Y-%m-%d')
         end_date = today.strftime('%Y-%m-%d')
-        
+
         data = ExpenseController.get_report_data(self.user.user_id, start_date, end_date)
-        
-        # Get dashboard data
         dashboard_data = ExpenseController.get_dashboard_data(self.user.user_id)
-        
+
+        # Aggregations the DB does in one pass instead of Python loops
+        dow_data = ExpenseController.get_dow_totals(self.user.user_id, start_date, end_date)
+        top_expenses = ExpenseController.get_top_expenses(self.user.user_id, start_date, end_date)
+
+        return data, dashboard_data, dow_data, top_expenses
+
+    def _on_data_ready(self, future):
+        """Worker-thread callback - marshal the result onto the Tk thread"""
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"❌ Error loading analytics data: {e}")
+            return
+
+        try:
+            self.after(0, self._apply_data, result)
+        except tk.TclError:
+            # View was destroyed while the fetch was in flight
+            pass
+
+    def _apply_data(self, result):
+        """Build/refresh the UI from fetched data (runs on the Tk thread)"""
+        if not self.winfo_exists():
+            return
+
+        if self._loading_label is not None:
+            self._loading_label.destroy()
+            self._loading_label = None
+
+        data, dashboard_data, dow_data, top_expenses = result
+
         # Process insights
         expenses = data.get('expenses', [])
         daily_data = data.get('daily_trend', [])
         monthly_data = data.get('monthly_trend', [])
         categories = data.get('category_totals', [])
         
-        # Calculate insights
-        total_spent = sum(float(e.amount) for e in expenses)
+        # Calculate insights - single C reductions instead of one Python
+        # frame per element when numpy is around
+        if NUMPY_AVAILABLE:
+            amounts = np.fromiter((float(e.amount) for e in expenses),
+                                  dtype=np.float64, count=len(expenses))
+            total_spent = float(amounts.sum())
+
+            daily_totals = np.fromiter((float(d['total']) for d in daily_data),
+                                       dtype=np.float64, count=len(daily_data))
+            highest_day = (daily_data[int(daily_totals.argmax())]
+                           if daily_totals.size else {'date': 'N/A', 'total': 0})
+
+            cat_totals = np.fromiter((float(c['total']) for c in categories),
+                                     dtype=np.float64, count=len(categories))
+            top_cat = (categories[int(cat_totals.argmax())]
+                       if cat_totals.size else {'category_name': 'N/A', 'total': 0})
+
+            monthly_totals = np.fromiter((float(d['total']) for d in monthly_data),
+                                         dtype=np.float64, count=len(monthly_data))
+            trend_increasing = (monthly_totals.size >= 2
+                                and monthly_totals[-1] > monthly_totals[-2])
+        else:
+            total_spent = sum(float(e.amount) for e in expenses)
+            highest_day = max(daily_data, key=lambda x: float(x['total'])) if daily_data else {'date': 'N/A', 'total': 0}
+            top_cat = max(categories, key=lambda x: float(x['total'])) if categories else {'category_name': 'N/A', 'total': 0}
+            monthly_totals = None
+            trend_increasing = len(monthly_data) > 1 and float(monthly_data[-1]['total']) > float(monthly_data[-2]['total'])
+
         count = len(expenses)
-        avg_daily = total_spent / 90 if total_spent > 0 else 0
+        # Divide by the actual report window instead of a hard-coded 90 -
+        # the fetched range is inclusive of both endpoints
+        try:
+            window_start = date.fromisoformat(str(data.get('start_date')))
+            window_end = date.fromisoformat(str(data.get('end_date')))
+            window_days = max((window_end - window_start).days + 1, 1)
+        except (TypeError, ValueError):
+            window_days = 91
+        avg_daily = total_spent / window_days if total_spent > 0 else 0
         avg_transaction = total_spent / count if count > 0 else 0
         
-        # Find highest day
-        highest_day = max(daily_data, key=lambda x: float(x['total'])) if daily_data else {'date': 'N/A', 'total': 0}
-        
-        # Find top category
-        top_cat = max(categories, key=lambda x: float(x['total'])) if categories else {'category_name': 'N/A', 'total': 0}
-        
         insights_data = {
             'avg_daily': avg_daily,
             'daily_change': '+12%',
@@ -758,7 +1045,7 @@ class AnalyticsView(tk.Frame):
             'highest_day_date': highest_day.get('date', 'N/A'),
             'top_category': top_cat.get('category_name', 'N/A').split(' ')[-1][:12],
             'top_category_amount': float(top_cat.get('total', 0)),
-            'trend_direction': 'Increasing' if len(monthly_data) > 1 and float(monthly_data[-1]['total']) > float(monthly_data[-2]['total']) else 'Decreasing',
+            'trend_direction': 'Increasing' if trend_increasing else 'Decreasing',
             'trend_percentage': '8%',
             'trend_positive': True
         }
@@ -772,10 +1059,10 @@ class AnalyticsView(tk.Frame):
         
         # Create UI
         self.create_insights_cards(insights_data)
-        self.create_spending_heatmap(daily_data)
+        self.create_spending_heatmap(dow_data, daily_data)
         self.create_category_breakdown(categories)
-        self.create_monthly_comparison(monthly_data)
-        self.create_top_expenses(expenses)
+        self.create_monthly_comparison(monthly_data, monthly_totals)
+        self.create_top_expenses(top_expenses)
         self.create_spending_patterns(patterns_data)
         self.create_recommendations({})
     
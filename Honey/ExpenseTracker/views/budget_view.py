@@ -3,45 +3,102 @@ Budget View
 Comprehensive budget management with category budgets, tracking, and alerts
 """
 
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
-import sys
-import os
+from contextlib import contextmanager
 from datetime import datetime
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.styles import COLORS, FONTS, CHART_COLORS
 from utils.helpers import format_currency
 from controllers.expense_controller import ExpenseController
 
-# Try to import matplotlib
+# Try to import numpy (ships with matplotlib) for vectorized aggregation
 try:
-    import matplotlib
-    matplotlib.use('TkAgg')
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    NUMPY_AVAILABLE = False
+
+# Budget amounts: plain non-negative numbers only
+_NUM_RE = re.compile(r'^\s*\d+(\.\d+)?\s*$')
+
+_STYLES_REGISTERED = False
+
+
+def _register_styles():
+    """
+    Register the progressbar styles for the budget bars (once).
+
+    ttk.Progressbar repaints in C and only the changed region, unlike
+    the old coloured-Frame-in-Frame bars which made Tk re-run geometry
+    on every resize.
+    """
+    global _STYLES_REGISTERED
+    if _STYLES_REGISTERED:
+        return
+    style = ttk.Style()
+    for prefix, color in (('Success', COLORS['success']),
+                          ('Warning', COLORS['warning']),
+                          ('Error', COLORS['error'])):
+        for family, thickness in (('Overall', 24), ('Cat', 8)):
+            style.configure(
+                f'{prefix}.{family}.Horizontal.TProgressbar',
+                troughcolor=COLORS['bg_tertiary'],
+                background=color,
+                borderwidth=0,
+                thickness=thickness
+            )
+    _STYLES_REGISTERED = True
 
 
 class BudgetView(tk.Frame):
     """Budget management and tracking view"""
-    
+
+    # Categories are static per session - fetched once and shared across
+    # view instances instead of re-queried on every refresh
+    _categories_cache = None
+
     def __init__(self, parent, user, on_navigate):
         super().__init__(parent, bg=COLORS['bg_secondary'])
         self.parent = parent
         self.user = user
         self.on_navigate = on_navigate
         self.budgets = {}  # category_id: budget_amount
-        
+
+        # One clock read per refresh instead of one per widget; the month
+        # label never changes for the lifetime of the view
+        self._now = datetime.now()
+        self._month_label = self._now.strftime('%B %Y')
+
+        # Widget pools - the card skeletons are built on the first render
+        # and later refreshes mutate labels/bars in place instead of
+        # destroying and recreating the whole subtree
+        self._overall_refs = None
+        self._category_cards = None
+        self._native_chart = None
+        self._tips_built = False
+
+        # Chart refreshes are coalesced: repeated requests in one event
+        # burst set the flag and only the last pending data gets drawn
+        self._chart_dirty = False
+        self._pending_chart_cats = None
+
+        # Last-rendered values per section - refreshes skip any widget
+        # whose underlying numbers did not change
+        self._last_snapshot = {}
+
+        # Last total budget that parsed cleanly, used when a refresh
+        # lands while the entry holds stray mid-edit text
+        self._last_total_budget = 0.0
+
         self.create_widgets()
         self.load_data()
     
     def create_widgets(self):
         """Create budget widgets"""
+        _register_styles()
+
         # Main scrollable container
         canvas = tk.Canvas(self, bg=COLORS['bg_secondary'], highlightthickness=0)
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
@@ -52,16 +109,22 @@ class BudgetView(tk.Frame):
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
         
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self._canvas = canvas
+        self._canvas_window = canvas.create_window(
+            (0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Bind mouse wheel
+        # Bind mouse wheel only while the pointer is over this view, and
+        # drop the global binding when the view is destroyed so scroll
+        # events never dispatch into a dead canvas
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        canvas.bind("<Destroy>", lambda e: canvas.unbind_all("<MouseWheel>"))
         
         # Content
         content = tk.Frame(self.scrollable_frame, bg=COLORS['bg_secondary'])
@@ -105,7 +168,7 @@ class BudgetView(tk.Frame):
         
         tk.Label(
             left,
-            text=f"Track and manage your spending limits • {datetime.now().strftime('%B %Y')}",
+            text=f"Track and manage your spending limits • {self._month_label}",
             font=FONTS['body'],
             bg=COLORS['bg_secondary'],
             fg=COLORS['text_secondary']
@@ -150,131 +213,178 @@ class BudgetView(tk.Frame):
         reset_btn.pack(side=tk.LEFT, padx=5)
     
     def create_overall_budget_card(self, data):
-        """Create overall budget summary card"""
-        # Clear existing
-        for widget in self.overall_frame.winfo_children():
-            widget.destroy()
-        
-        inner = tk.Frame(self.overall_frame, bg=COLORS['card_bg'])
+        """Create or refresh the overall budget summary card"""
+        if self._overall_refs is None:
+            self._build_overall_budget_card(data)
+        self._update_overall_budget_card(data)
+
+    def _build_overall_budget_card(self, data):
+        """Build the overall card skeleton once; returns nothing, stores refs"""
+        # Hoist the repeated style lookups out of the widget calls
+        card_bg = COLORS['card_bg']
+        bg_secondary = COLORS['bg_secondary']
+        text_primary = COLORS['text_primary']
+        text_secondary = COLORS['text_secondary']
+
+        inner = tk.Frame(self.overall_frame, bg=card_bg)
         inner.pack(fill=tk.X, padx=25, pady=20)
-        
+
         # Title
-        title_frame = tk.Frame(inner, bg=COLORS['card_bg'])
+        title_frame = tk.Frame(inner, bg=card_bg)
         title_frame.pack(fill=tk.X)
-        
+
         tk.Label(
             title_frame,
             text="💰 Monthly Budget Overview",
             font=FONTS['subheading'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
+            bg=card_bg,
+            fg=text_primary
         ).pack(side=tk.LEFT)
-        
+
         # Set overall budget
-        set_frame = tk.Frame(title_frame, bg=COLORS['card_bg'])
+        set_frame = tk.Frame(title_frame, bg=card_bg)
         set_frame.pack(side=tk.RIGHT)
-        
+
         tk.Label(
             set_frame,
             text="Total Budget: ₹",
             font=FONTS['body'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_secondary']
+            bg=card_bg,
+            fg=text_secondary
         ).pack(side=tk.LEFT)
-        
+
         self.total_budget_var = tk.StringVar(value=str(data.get('total_budget', 15000)))
         total_entry = tk.Entry(
             set_frame,
             textvariable=self.total_budget_var,
             font=FONTS['body_medium'],
             bg=COLORS['input_bg'],
-            fg=COLORS['text_primary'],
-            insertbackground=COLORS['text_primary'],
+            fg=text_primary,
+            insertbackground=text_primary,
             relief=tk.FLAT,
             width=12
         )
         total_entry.pack(side=tk.LEFT, padx=(5, 0), ipady=5)
-        
-        # Stats row
-        stats_frame = tk.Frame(inner, bg=COLORS['card_bg'])
+
+        # Stats row - grid with pre-weighted uniform columns resolves the
+        # geometry in one pass instead of a packer cascade per card
+        stats_frame = tk.Frame(inner, bg=card_bg)
         stats_frame.pack(fill=tk.X, pady=(25, 0))
-        
-        total_budget = float(self.total_budget_var.get() or 0)
-        total_spent = data.get('total_spent', 0)
-        remaining = max(total_budget - total_spent, 0)
-        percentage = min((total_spent / total_budget) * 100, 100) if total_budget > 0 else 0
-        
-        stats = [
-            ("Budget Set", format_currency(total_budget), COLORS['primary'], "🎯"),
-            ("Total Spent", format_currency(total_spent), COLORS['error'], "💸"),
-            ("Remaining", format_currency(remaining), COLORS['success'] if remaining > 0 else COLORS['error'], "💰"),
-            ("Used", f"{percentage:.1f}%", COLORS['warning'] if percentage > 80 else COLORS['info'], "📊")
-        ]
-        
-        for i, (label, value, color, icon) in enumerate(stats):
-            stat_card = tk.Frame(stats_frame, bg=COLORS['bg_secondary'])
-            stat_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-            
-            stat_inner = tk.Frame(stat_card, bg=COLORS['bg_secondary'])
-            stat_inner.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-            
+
+        stat_values = []
+        for i, (label, icon) in enumerate([("Budget Set", "🎯"), ("Total Spent", "💸"),
+                                           ("Remaining", "💰"), ("Used", "📊")]):
+            stats_frame.grid_columnconfigure(i, weight=1, uniform='stat')
+
+            stat_card = tk.Frame(stats_frame, bg=bg_secondary)
+            stat_card.grid(row=0, column=i, sticky='nsew', padx=5)
+            stat_card.grid_columnconfigure(0, weight=1)
+
             tk.Label(
-                stat_inner,
+                stat_card,
                 text=f"{icon} {label}",
                 font=FONTS['caption'],
-                bg=COLORS['bg_secondary'],
-                fg=COLORS['text_secondary']
-            ).pack(anchor='w')
-            
-            tk.Label(
-                stat_inner,
-                text=value,
+                bg=bg_secondary,
+                fg=text_secondary
+            ).grid(row=0, column=0, sticky='w', padx=15, pady=(15, 0))
+
+            value_label = tk.Label(
+                stat_card,
                 font=FONTS['heading_small'],
-                bg=COLORS['bg_secondary'],
-                fg=color
-            ).pack(anchor='w', pady=(5, 0))
-        
+                bg=bg_secondary
+            )
+            value_label.grid(row=1, column=0, sticky='w', padx=15, pady=(5, 15))
+            stat_values.append(value_label)
+
         # Progress bar
-        progress_frame = tk.Frame(inner, bg=COLORS['card_bg'])
+        progress_frame = tk.Frame(inner, bg=card_bg)
         progress_frame.pack(fill=tk.X, pady=(20, 0))
-        
+
         tk.Label(
             progress_frame,
             text="Budget Progress",
             font=FONTS['body_medium'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
+            bg=card_bg,
+            fg=text_primary
         ).pack(anchor='w', pady=(0, 10))
-        
-        progress_container = tk.Frame(progress_frame, bg=COLORS['bg_tertiary'], height=24)
-        progress_container.pack(fill=tk.X)
-        progress_container.pack_propagate(False)
-        
+
+        progress_bar = ttk.Progressbar(
+            progress_frame,
+            maximum=100,
+            style='Success.Overall.Horizontal.TProgressbar'
+        )
+        progress_bar.pack(fill=tk.X)
+
+        # Status message - two grid cells instead of LEFT/RIGHT packing
+        status_frame = tk.Frame(inner, bg=card_bg)
+        status_frame.pack(fill=tk.X, pady=(15, 0))
+        status_frame.grid_columnconfigure(0, weight=1)
+
+        status_label = tk.Label(
+            status_frame,
+            font=FONTS['body_medium'],
+            bg=card_bg
+        )
+        status_label.grid(row=0, column=0, sticky='w')
+
+        days_label = tk.Label(
+            status_frame,
+            font=FONTS['body'],
+            bg=card_bg,
+            fg=text_secondary
+        )
+        days_label.grid(row=0, column=1, sticky='e')
+
+        self._overall_refs = {
+            'stat_values': stat_values,
+            'progress_bar': progress_bar,
+            'status': status_label,
+            'days_left': days_label
+        }
+
+    def _update_overall_budget_card(self, data):
+        """Refresh the overall card labels and bar in place"""
+        refs = self._overall_refs
+
+        # The entry is user-editable - only trust it when it is numeric
+        total_text = self.total_budget_var.get().strip()
+        if _NUM_RE.match(total_text):
+            total_budget = float(total_text)
+            self._last_total_budget = total_budget
+        else:
+            total_budget = self._last_total_budget
+        total_spent = data.get('total_spent', 0)
+
+        snapshot = (total_budget, total_spent, self._now.day)
+        if self._last_snapshot.get('overall') == snapshot:
+            return
+        self._last_snapshot['overall'] = snapshot
+
+        remaining = max(total_budget - total_spent, 0)
+        percentage = min((total_spent / total_budget) * 100, 100) if total_budget > 0 else 0
+
+        stats = [
+            (format_currency(total_budget), COLORS['primary']),
+            (format_currency(total_spent), COLORS['error']),
+            (format_currency(remaining), COLORS['success'] if remaining > 0 else COLORS['error']),
+            (f"{percentage:.1f}%", COLORS['warning'] if percentage > 80 else COLORS['info'])
+        ]
+        for label, (value, color) in zip(refs['stat_values'], stats):
+            label.config(text=value, fg=color)
+
         # Determine color
         if percentage < 50:
-            bar_color = COLORS['success']
+            prefix = 'Success'
         elif percentage < 80:
-            bar_color = COLORS['warning']
+            prefix = 'Warning'
         else:
-            bar_color = COLORS['error']
-        
-        progress_bar = tk.Frame(progress_container, bg=bar_color, height=24)
-        progress_bar.place(relwidth=percentage/100, relheight=1)
-        
-        # Percentage text
-        if percentage > 8:
-            tk.Label(
-                progress_bar,
-                text=f"{percentage:.0f}% used",
-                font=FONTS['body_small'],
-                bg=bar_color,
-                fg=COLORS['text_white']
-            ).place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        
-        # Status message
-        status_frame = tk.Frame(inner, bg=COLORS['card_bg'])
-        status_frame.pack(fill=tk.X, pady=(15, 0))
-        
+            prefix = 'Error'
+
+        refs['progress_bar'].configure(
+            style=f'{prefix}.Overall.Horizontal.TProgressbar',
+            value=percentage
+        )
+
         if percentage >= 100:
             status = "⚠️ Budget exceeded! Consider reducing expenses."
             status_color = COLORS['error']
@@ -287,33 +397,41 @@ class BudgetView(tk.Frame):
         else:
             status = "✅ Great job! You're well within budget."
             status_color = COLORS['success']
-        
-        tk.Label(
-            status_frame,
-            text=status,
-            font=FONTS['body_medium'],
-            bg=COLORS['card_bg'],
-            fg=status_color
-        ).pack(side=tk.LEFT)
-        
-        days_left = 30 - datetime.now().day + 1
-        tk.Label(
-            status_frame,
-            text=f"{days_left} days left in month",
-            font=FONTS['body'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_secondary']
-        ).pack(side=tk.RIGHT)
+
+        refs['status'].config(text=status, fg=status_color)
+
+        days_left = 30 - self._now.day + 1
+        refs['days_left'].config(text=f"{days_left} days left in month")
     
     def create_budget_chart(self, categories):
-        """Create budget vs spent chart"""
-        # Clear existing
+        """Create or refresh the budget vs spent chart"""
+        cats = categories[:8]
+
+        if cats:
+            # 16 rectangles don't need a rasterizer - draw them straight
+            # on a Tk canvas. Rebuild only when the membership/order of
+            # the top slice changed; otherwise the labels are still valid
+            names = [c['name'][:10] for c in cats]
+            if (self._native_chart is None
+                    or self._native_chart['names'] != names):
+                self._build_native_chart(cats)
+
+            # Coalesce: back-to-back refreshes overwrite the pending data
+            # and the chart is moved/rendered once when the loop is idle
+            self._pending_chart_cats = cats
+            if not self._chart_dirty:
+                self._chart_dirty = True
+                self.after_idle(self._do_chart_update)
+            return
+
+        # Fallback text display (no categories)
         for widget in self.chart_frame.winfo_children():
             widget.destroy()
-        
+        self._native_chart = None
+
         inner = tk.Frame(self.chart_frame, bg=COLORS['card_bg'])
         inner.pack(fill=tk.X, padx=25, pady=20)
-        
+
         tk.Label(
             inner,
             text="📊 Budget vs Actual by Category",
@@ -321,205 +439,321 @@ class BudgetView(tk.Frame):
             bg=COLORS['card_bg'],
             fg=COLORS['text_primary']
         ).pack(anchor='w', pady=(0, 15))
-        
-        if MATPLOTLIB_AVAILABLE and categories:
-            fig = Figure(figsize=(10, 4), dpi=100, facecolor=COLORS['card_bg'])
-            ax = fig.add_subplot(111)
-            
-            cat_names = [c['name'][:10] for c in categories[:8]]
-            budgets_vals = [float(c.get('budget', 0)) for c in categories[:8]]
-            spent_vals = [float(c.get('spent', 0)) for c in categories[:8]]
-            
-            x = range(len(cat_names))
-            width = 0.35
-            
-            bars1 = ax.bar([i - width/2 for i in x], budgets_vals, width, label='Budget', color=COLORS['primary'], alpha=0.8)
-            bars2 = ax.bar([i + width/2 for i in x], spent_vals, width, label='Spent', color=COLORS['secondary'], alpha=0.8)
-            
-            ax.set_xticks(x)
-            ax.set_xticklabels(cat_names, fontsize=9)
-            ax.set_facecolor(COLORS['card_bg'])
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(COLORS['border'])
-            ax.spines['bottom'].set_color(COLORS['border'])
-            ax.tick_params(colors=COLORS['text_secondary'])
-            ax.legend(loc='upper right', fontsize=9)
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(
-                lambda x, p: f'₹{x/1000:.0f}k' if x >= 1000 else f'₹{x:.0f}'))
-            
-            fig.tight_layout()
-            
-            canvas = FigureCanvasTkAgg(fig, inner)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.X)
-        else:
-            # Fallback text display
-            self.create_text_comparison(inner, categories)
-    
+
+        self.create_text_comparison(inner, categories)
+
+    def _build_native_chart(self, cats):
+        """
+        Build the chart once as plain Tk canvas items.
+
+        For a handful of bars the matplotlib pipeline (Figure + Agg
+        rasterization + RGBA-to-Tk image copy) dominated the refresh
+        cost; create_rectangle/create_text items are orders of magnitude
+        cheaper and refreshes just move their coordinates.
+        """
+        for widget in self.chart_frame.winfo_children():
+            widget.destroy()
+
+        card_bg = COLORS['card_bg']
+        text_secondary = COLORS['text_secondary']
+
+        inner = tk.Frame(self.chart_frame, bg=card_bg)
+        inner.pack(fill=tk.X, padx=25, pady=20)
+
+        tk.Label(
+            inner,
+            text="📊 Budget vs Actual by Category",
+            font=FONTS['subheading'],
+            bg=card_bg,
+            fg=COLORS['text_primary']
+        ).pack(anchor='w', pady=(0, 15))
+
+        width, height = 860, 300
+        left, right, top, bottom = 60, 20, 25, 40
+        plot_h = height - top - bottom
+        baseline = top + plot_h
+        group = (width - left - right) / len(cats)
+        bar_w = group * 0.3
+
+        canvas = tk.Canvas(inner, width=width, height=height,
+                           bg=card_bg, highlightthickness=0)
+        canvas.pack(fill=tk.X)
+
+        # Axes
+        canvas.create_line(left, top, left, baseline, fill=COLORS['border'])
+        canvas.create_line(left, baseline, width - right, baseline,
+                           fill=COLORS['border'])
+
+        # Y tick labels - the texts are filled in on refresh once the
+        # scale is known
+        y_ticks = []
+        for i in range(5):
+            y = baseline - plot_h * i / 4
+            canvas.create_line(left - 4, y, left, y, fill=COLORS['border'])
+            y_ticks.append(canvas.create_text(
+                left - 8, y, anchor='e', text='',
+                fill=text_secondary, font=FONTS['caption']))
+
+        # Category names and the zero-height bar pairs
+        rects_budget = []
+        rects_spent = []
+        for i, cat in enumerate(cats):
+            cx = left + group * (i + 0.5)
+            canvas.create_text(cx, baseline + 14, text=cat['name'][:10],
+                               fill=text_secondary, font=FONTS['caption'])
+            rects_budget.append(canvas.create_rectangle(
+                cx - bar_w, baseline, cx, baseline,
+                fill=COLORS['primary'], outline=''))
+            rects_spent.append(canvas.create_rectangle(
+                cx, baseline, cx + bar_w, baseline,
+                fill=COLORS['secondary'], outline=''))
+
+        # Legend
+        lx = width - right - 150
+        canvas.create_rectangle(lx, 8, lx + 10, 18,
+                                fill=COLORS['primary'], outline='')
+        canvas.create_text(lx + 16, 13, anchor='w', text='Budget',
+                           fill=text_secondary, font=FONTS['caption'])
+        canvas.create_rectangle(lx + 80, 8, lx + 90, 18,
+                                fill=COLORS['secondary'], outline='')
+        canvas.create_text(lx + 96, 13, anchor='w', text='Spent',
+                           fill=text_secondary, font=FONTS['caption'])
+
+        self._native_chart = {
+            'canvas': canvas,
+            'rects_budget': rects_budget,
+            'rects_spent': rects_spent,
+            'y_ticks': y_ticks,
+            'baseline': baseline,
+            'plot_h': plot_h,
+            'names': [c['name'][:10] for c in cats]
+        }
+
+    def _update_native_chart(self, cats):
+        """Reshape the canvas bars to the new values - no rasterization"""
+        chart = self._native_chart
+        canvas = chart['canvas']
+
+        budgets_vals = [float(c.get('budget', 0)) for c in cats]
+        spent_vals = [float(c.get('spent', 0)) for c in cats]
+
+        snapshot = (tuple(budgets_vals), tuple(spent_vals))
+        if self._last_snapshot.get('chart') == snapshot:
+            return
+        self._last_snapshot['chart'] = snapshot
+
+        baseline = chart['baseline']
+        top_val = max(max(budgets_vals), max(spent_vals), 1) * 1.15
+        scale = chart['plot_h'] / top_val
+
+        for rect, v in zip(chart['rects_budget'], budgets_vals):
+            x0, _, x1, _ = canvas.coords(rect)
+            canvas.coords(rect, x0, baseline - v * scale, x1, baseline)
+        for rect, v in zip(chart['rects_spent'], spent_vals):
+            x0, _, x1, _ = canvas.coords(rect)
+            canvas.coords(rect, x0, baseline - v * scale, x1, baseline)
+
+        for i, tick in enumerate(chart['y_ticks']):
+            v = top_val * i / 4
+            label = f'₹{v/1000:.0f}k' if v >= 1000 else f'₹{v:.0f}'
+            canvas.itemconfigure(tick, text=label)
+
+    def _do_chart_update(self):
+        """Apply the most recent pending chart data in one pass"""
+        self._chart_dirty = False
+        cats = self._pending_chart_cats
+        if not cats or not self.winfo_exists():
+            return
+        if self._native_chart:
+            self._update_native_chart(cats)
+
     def create_text_comparison(self, parent, categories):
         """Text-based budget comparison"""
+        card_bg = COLORS['card_bg']
+
         for cat in categories[:6]:
-            row = tk.Frame(parent, bg=COLORS['card_bg'])
+            row = tk.Frame(parent, bg=card_bg)
             row.pack(fill=tk.X, pady=8)
-            
+
             budget = float(cat.get('budget', 0))
             spent = float(cat.get('spent', 0))
-            percentage = (spent / budget * 100) if budget > 0 else 0
-            
+            percentage = cat.get('pct', 0)
+
             tk.Label(
                 row,
                 text=f"{cat.get('icon', '📦')} {cat['name'][:15]}",
                 font=FONTS['body_medium'],
-                bg=COLORS['card_bg'],
+                bg=card_bg,
                 fg=COLORS['text_primary'],
                 width=18,
                 anchor='w'
             ).pack(side=tk.LEFT)
-            
+
             # Progress bar
             bar_frame = tk.Frame(row, bg=COLORS['bg_tertiary'], height=12, width=300)
             bar_frame.pack(side=tk.LEFT, padx=10)
             bar_frame.pack_propagate(False)
-            
-            bar_color = COLORS['success'] if percentage < 80 else (COLORS['warning'] if percentage < 100 else COLORS['error'])
-            bar = tk.Frame(bar_frame, bg=bar_color, height=12)
+
+            bar = tk.Frame(bar_frame, bg=cat.get('bar_color', COLORS['success']), height=12)
             bar.place(relwidth=min(percentage, 100)/100, relheight=1)
-            
+
             tk.Label(
                 row,
                 text=f"{format_currency(spent)} / {format_currency(budget)}",
                 font=FONTS['body'],
-                bg=COLORS['card_bg'],
+                bg=card_bg,
                 fg=COLORS['text_secondary']
             ).pack(side=tk.RIGHT)
     
     def create_category_budgets(self, categories):
-        """Create category budget cards"""
-        # Clear existing
-        for widget in self.categories_frame.winfo_children():
-            widget.destroy()
-        
-        # Title
-        tk.Label(
-            self.categories_frame,
-            text="📂 Set Category Budgets",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['text_primary']
-        ).pack(anchor='w', pady=(0, 15))
-        
-        # Grid container
-        grid = tk.Frame(self.categories_frame, bg=COLORS['bg_secondary'])
-        grid.pack(fill=tk.BOTH, expand=True)
-        
-        # Configure grid columns
-        for i in range(3):
-            grid.columnconfigure(i, weight=1, uniform='col')
-        
-        self.budget_entries = {}
-        
-        for i, cat in enumerate(categories):
-            self.create_category_budget_card(grid, cat, i)
-    
-    def create_category_budget_card(self, parent, category, index):
-        """Create individual category budget card"""
+        """Create or refresh category budget cards"""
+        if self._category_cards is None:
+            # First render - build the grid and one card per category
+            tk.Label(
+                self.categories_frame,
+                text="📂 Set Category Budgets",
+                font=FONTS['subheading'],
+                bg=COLORS['bg_secondary'],
+                fg=COLORS['text_primary']
+            ).pack(anchor='w', pady=(0, 15))
+
+            # Grid container
+            grid = tk.Frame(self.categories_frame, bg=COLORS['bg_secondary'])
+            grid.pack(fill=tk.BOTH, expand=True)
+
+            # Configure grid columns
+            for i in range(3):
+                grid.columnconfigure(i, weight=1, uniform='col')
+
+            self.budget_entries = {}
+            self._category_cards = {}
+            for i, cat in enumerate(categories):
+                self._category_cards[cat['id']] = \
+                    self._build_category_budget_card(grid, cat, i)
+
+        for cat in categories:
+            refs = self._category_cards.get(cat['id'])
+            if refs is None:
+                continue
+            snapshot = (float(cat.get('spent', 0)), float(cat.get('budget', 0)))
+            if self._last_snapshot.get(cat['id']) == snapshot:
+                continue
+            self._update_category_budget_card(refs, cat)
+            self._last_snapshot[cat['id']] = snapshot
+
+    def _build_category_budget_card(self, parent, category, index):
+        """Build one category card skeleton; returns its mutable widgets"""
         row = index // 3
         col = index % 3
-        
-        card = tk.Frame(parent, bg=COLORS['card_bg'], cursor='hand2')
+
+        # Hoist the repeated style lookups out of the widget calls
+        card_bg = COLORS['card_bg']
+        text_primary = COLORS['text_primary']
+        text_secondary = COLORS['text_secondary']
+        f_caption = FONTS['caption']
+        f_body = FONTS['body']
+        f_body_medium = FONTS['body_medium']
+
+        # One gridded frame per card - cell padding replaces the old
+        # stack of nested header/info/budget layout frames
+        card = tk.Frame(parent, bg=card_bg, cursor='hand2')
         card.grid(row=row, column=col, sticky='nsew', padx=8, pady=8)
-        
-        inner = tk.Frame(card, bg=COLORS['card_bg'])
-        inner.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
-        
-        # Header with icon and name
-        header = tk.Frame(inner, bg=COLORS['card_bg'])
-        header.pack(fill=tk.X)
-        
-        icon_frame = tk.Frame(header, bg=category.get('color', COLORS['primary']), width=40, height=40)
-        icon_frame.pack(side=tk.LEFT)
-        icon_frame.pack_propagate(False)
-        
-        tk.Label(
-            icon_frame,
-            text=category.get('icon', '📦'),
-            font=FONTS['body_large'],
-            bg=category.get('color', COLORS['primary']),
-            fg=COLORS['text_white']
-        ).place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        
+        card.columnconfigure(1, weight=1)
+
+        # Header: icon and name in one label
         tk.Label(
-            header,
-            text=category['name'],
-            font=FONTS['body_medium'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_primary']
-        ).pack(side=tk.LEFT, padx=(12, 0))
-        
+            card,
+            text=f"{category.get('icon', '📦')} {category['name']}",
+            font=f_body_medium,
+            bg=card_bg,
+            fg=text_primary
+        ).grid(row=0, column=0, columnspan=2, sticky='w', padx=20, pady=(15, 0))
+
         # Spent info
-        spent = float(category.get('spent', 0))
-        budget = float(category.get('budget', 0))
-        
-        info_frame = tk.Frame(inner, bg=COLORS['card_bg'])
-        info_frame.pack(fill=tk.X, pady=(15, 0))
-        
         tk.Label(
-            info_frame,
+            card,
             text="Spent this month:",
-            font=FONTS['caption'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_secondary']
-        ).pack(side=tk.LEFT)
-        
-        tk.Label(
-            info_frame,
-            text=format_currency(spent),
-            font=FONTS['body_medium'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['error'] if spent > budget and budget > 0 else COLORS['text_primary']
-        ).pack(side=tk.RIGHT)
-        
+            font=f_caption,
+            bg=card_bg,
+            fg=text_secondary
+        ).grid(row=1, column=0, sticky='w', padx=(20, 0), pady=(15, 0))
+
+        spent_label = tk.Label(
+            card,
+            font=f_body_medium,
+            bg=card_bg
+        )
+        spent_label.grid(row=1, column=1, sticky='e', padx=(0, 20), pady=(15, 0))
+
         # Budget input
-        budget_frame = tk.Frame(inner, bg=COLORS['card_bg'])
-        budget_frame.pack(fill=tk.X, pady=(10, 0))
-        
         tk.Label(
-            budget_frame,
+            card,
             text="Budget: ₹",
-            font=FONTS['body'],
-            bg=COLORS['card_bg'],
-            fg=COLORS['text_secondary']
-        ).pack(side=tk.LEFT)
-        
-        budget_var = tk.StringVar(value=str(int(budget)) if budget > 0 else "")
+            font=f_body,
+            bg=card_bg,
+            fg=text_secondary
+        ).grid(row=2, column=0, sticky='w', padx=(20, 0), pady=(10, 0))
+
+        budget_var = tk.StringVar()
         budget_entry = tk.Entry(
-            budget_frame,
+            card,
             textvariable=budget_var,
-            font=FONTS['body'],
+            font=f_body,
             bg=COLORS['input_bg'],
-            fg=COLORS['text_primary'],
-            insertbackground=COLORS['text_primary'],
+            fg=text_primary,
+            insertbackground=text_primary,
             relief=tk.FLAT,
             width=10
         )
-        budget_entry.pack(side=tk.RIGHT, ipady=5)
-        
+        budget_entry.grid(row=2, column=1, sticky='e', padx=(0, 20),
+                          pady=(10, 0), ipady=5)
+
         self.budget_entries[category['id']] = budget_var
-        
+
         # Progress bar
-        percentage = (spent / budget * 100) if budget > 0 else 0
-        
-        progress_frame = tk.Frame(inner, bg=COLORS['bg_tertiary'], height=8)
-        progress_frame.pack(fill=tk.X, pady=(12, 0))
-        
-        if budget > 0:
-            bar_color = COLORS['success'] if percentage < 80 else (COLORS['warning'] if percentage < 100 else COLORS['error'])
-            progress = tk.Frame(progress_frame, bg=bar_color, height=8)
-            progress.place(relwidth=min(percentage, 100)/100, relheight=1)
-        
+        bar = ttk.Progressbar(
+            card,
+            maximum=100,
+            style='Success.Cat.Horizontal.TProgressbar'
+        )
+        bar.grid(row=3, column=0, columnspan=2, sticky='ew',
+                 padx=20, pady=(12, 15))
+
         # Status
+        status_label = tk.Label(
+            card,
+            font=f_caption,
+            bg=card_bg
+        )
+
+        return {
+            'var': budget_var,
+            'spent': spent_label,
+            'bar': bar,
+            'status': status_label
+        }
+
+    def _update_category_budget_card(self, refs, category):
+        """Refresh one category card's labels and progress bar in place"""
+        spent = float(category.get('spent', 0))
+        budget = float(category.get('budget', 0))
+
+        refs['spent'].config(
+            text=format_currency(spent),
+            fg=COLORS['error'] if spent > budget and budget > 0 else COLORS['text_primary']
+        )
+        refs['var'].set(str(int(budget)) if budget > 0 else "")
+
+        percentage = category.get('pct', 0)
+
         if budget > 0:
+            prefix = 'Success' if percentage < 80 else (
+                'Warning' if percentage < 100 else 'Error')
+            refs['bar'].configure(
+                style=f'{prefix}.Cat.Horizontal.TProgressbar',
+                value=min(percentage, 100)
+            )
+
             if percentage >= 100:
                 status = f"⚠️ Over by {format_currency(spent - budget)}"
                 status_color = COLORS['error']
@@ -529,62 +763,65 @@ class BudgetView(tk.Frame):
             else:
                 status = f"✅ {format_currency(budget - spent)} left"
                 status_color = COLORS['success']
-            
-            tk.Label(
-                inner,
-                text=status,
-                font=FONTS['caption'],
-                bg=COLORS['card_bg'],
-                fg=status_color
-            ).pack(anchor='w', pady=(8, 0))
+
+            refs['status'].config(text=status, fg=status_color)
+            if not refs['status'].winfo_manager():
+                refs['status'].grid(row=4, column=0, columnspan=2,
+                                    sticky='w', padx=20, pady=(0, 12))
+        else:
+            refs['bar'].configure(value=0)
+            refs['status'].grid_remove()
     
     def create_tips(self):
-        """Create budget tips section"""
-        # Clear existing
-        for widget in self.tips_frame.winfo_children():
-            widget.destroy()
-        
-        inner = tk.Frame(self.tips_frame, bg=COLORS['card_bg'])
+        """Create budget tips section (static content - built once)"""
+        if self._tips_built:
+            return
+        self._tips_built = True
+
+        card_bg = COLORS['card_bg']
+        bg_secondary = COLORS['bg_secondary']
+
+        inner = tk.Frame(self.tips_frame, bg=card_bg)
         inner.pack(fill=tk.X, padx=25, pady=20)
-        
+
         tk.Label(
             inner,
             text="💡 Smart Budgeting Tips",
             font=FONTS['subheading'],
-            bg=COLORS['card_bg'],
+            bg=card_bg,
             fg=COLORS['text_primary']
         ).pack(anchor='w', pady=(0, 15))
-        
+
         tips = [
             ("50/30/20 Rule", "Allocate 50% for needs, 30% for wants, 20% for savings"),
             ("Track Daily", "Review your expenses daily to stay on top of spending"),
             ("Set Alerts", "Create alerts when you reach 80% of category budgets"),
             ("Review Monthly", "Analyze your spending patterns at the end of each month")
         ]
-        
-        tips_grid = tk.Frame(inner, bg=COLORS['card_bg'])
+
+        tips_grid = tk.Frame(inner, bg=card_bg)
         tips_grid.pack(fill=tk.X)
-        
+
         for i, (title, desc) in enumerate(tips):
-            tip_frame = tk.Frame(tips_grid, bg=COLORS['bg_secondary'])
+            tip_frame = tk.Frame(tips_grid, bg=bg_secondary)
             tip_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-            
-            tip_inner = tk.Frame(tip_frame, bg=COLORS['bg_secondary'])
+
+            tip_inner = tk.Frame(tip_frame, bg=bg_secondary)
             tip_inner.pack(fill=tk.BOTH, expand=True, padx=15, pady=12)
-            
+
             tk.Label(
                 tip_inner,
                 text=f"#{i+1} {title}",
                 font=FONTS['body_medium'],
-                bg=COLORS['bg_secondary'],
+                bg=bg_secondary,
                 fg=COLORS['primary']
             ).pack(anchor='w')
-            
+
             tk.Label(
                 tip_inner,
                 text=desc,
                 font=FONTS['caption'],
-                bg=COLORS['bg_secondary'],
+                bg=bg_secondary,
                 fg=COLORS['text_secondary'],
                 wraplength=200,
                 justify='left'
@@ -592,27 +829,44 @@ class BudgetView(tk.Frame):
     
     def save_all_budgets(self):
         """Save all budget settings"""
+        # Validate every entry in one pass before touching the database,
+        # so one bad value cannot leave a partial save behind - the regex
+        # check is also cheaper than bouncing off float()'s ValueError
+        total_text = self.total_budget_var.get().strip()
+        if total_text and not _NUM_RE.match(total_text):
+            messagebox.showerror("Error", "Please enter a valid number for the total budget")
+            return
+
+        new_budgets = {}
+        bad = []
+        for cat_id, var in self.budget_entries.items():
+            text = var.get().strip()
+            if not text:
+                new_budgets[cat_id] = 0.0
+            elif _NUM_RE.match(text):
+                new_budgets[cat_id] = float(text)
+            else:
+                bad.append(cat_id)
+
+        if bad:
+            messagebox.showerror(
+                "Error",
+                f"Please enter valid numbers for budgets ({len(bad)} invalid)"
+            )
+            return
+
         try:
-            # Save total budget
-            total_budget = float(self.total_budget_var.get() or 0)
-            
-            # Save category budgets
-            for cat_id, var in self.budget_entries.items():
-                budget_value = float(var.get() or 0)
-                self.budgets[cat_id] = budget_value
-                
-                # Save to database
-                ExpenseController.set_category_budget(
-                    self.user.user_id,
-                    cat_id,
-                    budget_value
-                )
-            
-            messagebox.showinfo("Success", "Budgets saved successfully! 🎉")
-            self.load_data()  # Refresh
-            
-        except ValueError as e:
-            messagebox.showerror("Error", "Please enter valid numbers for budgets")
+            self.budgets.update(new_budgets)
+
+            # Save all categories in a single transaction
+            success = ExpenseController.set_category_budgets_bulk(
+                self.user.user_id, new_budgets)
+
+            if success:
+                messagebox.showinfo("Success", "Budgets saved successfully! 🎉")
+                self.load_data()  # Refresh
+            else:
+                messagebox.showerror("Error", "Failed to save budgets")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save budgets: {str(e)}")
     
@@ -626,28 +880,36 @@ class BudgetView(tk.Frame):
     
     def load_data(self):
         """Load budget data"""
+        # Refresh the cached clock so days-left stays current
+        self._now = datetime.now()
+
         # Get category data with spending
         data = ExpenseController.get_dashboard_data(self.user.user_id)
         category_totals = data.get('category_totals', [])
-        
-        # Get all categories
-        categories = ExpenseController.get_categories()
-        
+
+        # Index totals by category once - the merge loop below is then a
+        # dict lookup per category instead of a scan over all totals
+        totals_by_id = {c['category_id']: c.get('total', 0) for c in category_totals}
+
+        # Get all categories (cached - the list doesn't change at runtime)
+        if BudgetView._categories_cache is None:
+            BudgetView._categories_cache = ExpenseController.get_categories()
+        categories = BudgetView._categories_cache
+
+        # One query for every saved budget instead of one per category
+        budgets_map = ExpenseController.get_all_category_budgets(self.user.user_id)
+
         # Merge data
         category_data = []
         total_spent = 0
-        
+
         for cat in categories:
-            cat_total = next(
-                (c for c in category_totals if c['category_id'] == cat.category_id),
-                {'total': 0}
-            )
-            spent = float(cat_total.get('total', 0))
+            spent = float(totals_by_id.get(cat.category_id, 0))
             total_spent += spent
-            
+
             # Get saved budget (from DB or default)
-            budget = ExpenseController.get_category_budget(self.user.user_id, cat.category_id)
-            
+            budget = budgets_map.get(cat.category_id, 0)
+
             category_data.append({
                 'id': cat.category_id,
                 'name': cat.name,
@@ -663,9 +925,83 @@ class BudgetView(tk.Frame):
             'total_spent': total_spent
         })
         
-        self.create_budget_chart(category_data)
-        self.create_category_budgets(category_data)
-        self.create_tips()
+        # The chart only shows the top spenders; category_totals is
+        # already ORDER BY total DESC in SQL, so reuse that ordering
+        # instead of re-sorting (or arbitrarily slicing) in Python
+        data_by_id = {c['id']: c for c in category_data}
+        chart_data = [data_by_id[c['category_id']]
+                      for c in category_totals[:8]
+                      if c['category_id'] in data_by_id]
+
+        # Percentages and bar colours are shared by the grid, the chart
+        # fallback and the status lines - compute them once here
+        self._annotate_percentages(category_data)
+
+        # The overall card is what the user lands on - paint it now and
+        # let the chart/grid/tips build once the event loop breathes
+        self.after_idle(self._build_rest, chart_data, category_data)
+
+    @staticmethod
+    def _annotate_percentages(category_data):
+        """Attach pct/bar_color to each category dict in one pass"""
+        if not category_data:
+            return
+
+        if NUMPY_AVAILABLE:
+            n = len(category_data)
+            budgets_arr = np.fromiter((c['budget'] for c in category_data),
+                                      np.float64, n)
+            spent_arr = np.fromiter((c['spent'] for c in category_data),
+                                    np.float64, n)
+            pct_arr = np.where(budgets_arr > 0,
+                               spent_arr / np.maximum(budgets_arr, 1e-9) * 100,
+                               0.0)
+            colors = np.select([pct_arr < 80, pct_arr < 100],
+                               [COLORS['success'], COLORS['warning']],
+                               default=COLORS['error'])
+            for c, pct, color in zip(category_data, pct_arr, colors):
+                c['pct'] = float(pct)
+                c['bar_color'] = str(color)
+        else:
+            for c in category_data:
+                budget = c['budget']
+                pct = (c['spent'] / budget * 100) if budget > 0 else 0
+                c['pct'] = pct
+                c['bar_color'] = COLORS['success'] if pct < 80 else (
+                    COLORS['warning'] if pct < 100 else COLORS['error'])
+
+    @contextmanager
+    def _suspend_layout(self):
+        """
+        Unmap the scrolled content while a heavy build runs.
+
+        With the frame hidden Tk skips the intermediate redraw/relayout
+        after every pack/grid call; everything is laid out in one pass
+        when the frame reappears.
+        """
+        self._canvas.itemconfigure(self._canvas_window, state='hidden')
+        try:
+            yield
+        finally:
+            self._canvas.itemconfigure(self._canvas_window, state='normal')
+            self.update_idletasks()
+
+    def _build_rest(self, chart_data, category_data):
+        """Build/refresh the below-the-fold sections"""
+        if not self.winfo_exists():
+            return
+
+        if self._category_cards is None:
+            # First build constructs dozens of widgets - batch the layout
+            with self._suspend_layout():
+                self.create_budget_chart(chart_data)
+                self.create_category_budgets(category_data)
+                self.create_tips()
+        else:
+            # Warm refresh only mutates existing widgets
+            self.create_budget_chart(chart_data)
+            self.create_category_budgets(category_data)
+            self.create_tips()
     
     def refresh(self):
         """Refresh budget view"""
@@ -7,10 +7,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from tkcalendar import DateEntry
 from datetime import datetime, date
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.styles import COLORS, FONTS, DIMENSIONS
 from utils.helpers import format_currency, PAYMENT_METHODS
@@ -4,12 +4,20 @@ Modern login with remember me, animations, and better UX
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import sys
 import os
-import json
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Parse/serialize credentials straight from bytes - orjson when it is
+# installed, stdlib json otherwise (json.loads accepts bytes directly)
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 from utils.styles import COLORS, FONTS, DIMENSIONS
 from controllers.auth_controller import AuthController
@@ -17,185 +25,286 @@ from controllers.auth_controller import AuthController
 
 # Path to save login credentials
 CREDENTIALS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'saved_login.json')
+_CRED_DIR = os.path.dirname(CREDENTIALS_FILE)
+
+# Flips on the first save so later saves skip the makedirs stat
+_cred_dir_ready = False
+
+# Whether a credentials file is on disk - clearing can short-circuit
+# instead of touching the filesystem on every remember-me-off login
+_has_saved_creds = os.path.exists(CREDENTIALS_FILE)
+
+# Branding-panel styling, shared by every build
+_GRADIENT_COLORS = ('#667EEA', '#6B5CE7', '#7647E0', '#8040D8', '#764BA2')
+_GRAD_MID = _GRADIENT_COLORS[2]
+_WHITE_ON_GRAD = {'bg': _GRAD_MID, 'fg': COLORS['text_white']}
+_MUTED_ON_GRAD = {'bg': _GRAD_MID, 'fg': '#E2E8F0'}
 
 
 class LoginView(tk.Frame):
     """Enhanced Login and Registration View"""
-    
+
+    # Parsed saved_login.json, shared across instances and reused
+    # until the file's mtime changes
+    _cred_cache = None
+    _cred_mtime = 0
+
+    # Branding panel built once per process - it never changes, and
+    # rebuilding its ~25 widgets costs a Tcl round-trip each
+    _left_panel = None
+
+    _FEATURES = (
+        ("📊", "Track Expenses", "Monitor daily spending"),
+        ("🎯", "Set Budgets", "Control your finances"),
+        ("📈", "Visual Reports", "Charts & analytics"),
+        ("💾", "Export Data", "Download reports"),
+    )
+
     def __init__(self, parent, on_login_success):
         super().__init__(parent, bg=COLORS['bg_secondary'])
         self.parent = parent
         self.on_login_success = on_login_success
         self.is_login_mode = True
         self.remember_var = tk.BooleanVar(value=False)
-        
+
+        # Each form keeps its own entry dict; _entries points at the
+        # active one so the submit handlers stay form-agnostic
+        self._login_entries = {}
+        self._register_entries = {}
+        self._entries = self._login_entries
+        self._login_frame = None
+        self._register_frame = None
+
         self.create_widgets()
-        self.load_saved_credentials()
-    
+
+    @classmethod
+    def _read_credentials(cls):
+        """Get the parsed credentials dict, reusing the cached parse while the file is unchanged"""
+        try:
+            st = os.stat(CREDENTIALS_FILE)
+        except OSError:
+            return None
+        if cls._cred_cache is None or st.st_mtime_ns != cls._cred_mtime:
+            with open(CREDENTIALS_FILE, 'rb') as f:
+                cls._cred_cache = _loads(f.read())
+            cls._cred_mtime = st.st_mtime_ns
+        return cls._cred_cache
+
     def load_saved_credentials(self):
         """Load saved login credentials if remember me was checked"""
         try:
-            if os.path.exists(CREDENTIALS_FILE):
-                with open(CREDENTIALS_FILE, 'r') as f:
-                    data = json.load(f)
-                    if data.get('remember') and self.is_login_mode:
-                        saved_username = data.get('username', '')
-                        saved_password = data.get('password', '')
-                        
-                        if saved_username:
-                            # Clear placeholder and insert saved username
-                            self.username_entry.delete(0, tk.END)
-                            self.username_entry.insert(0, saved_username)
-                            self.username_entry.config(fg=COLORS['text_primary'])
-                        
-                        if saved_password:
-                            # Clear placeholder and insert saved password
-                            self.password_entry.delete(0, tk.END)
-                            self.password_entry.insert(0, saved_password)
-                            self.password_entry.config(fg=COLORS['text_primary'], show='•')
-                        
-                        self.remember_var.set(True)
+            data = self._read_credentials()
+            if data and data.get('remember') and self.is_login_mode:
+                saved_username = data.get('username', '')
+                saved_password = data.get('password', '')
+
+                if saved_username:
+                    # Clear placeholder and insert saved username
+                    entry = self._entries['username']
+                    entry.delete(0, tk.END)
+                    entry.insert(0, saved_username)
+                    entry.config(fg=COLORS['text_primary'])
+
+                if saved_password:
+                    # Clear placeholder and insert saved password
+                    entry = self._entries['password']
+                    entry.delete(0, tk.END)
+                    entry.insert(0, saved_password)
+                    entry.config(fg=COLORS['text_primary'], show='•')
+
+                self.remember_var.set(True)
         except Exception as e:
             print(f"Could not load saved credentials: {e}")
-    
+
     def save_credentials(self, username, password):
         """Save login credentials"""
+        global _cred_dir_ready, _has_saved_creds
+        data = {
+            'username': username,
+            'password': password,
+            'remember': True
+        }
         try:
-            os.makedirs(os.path.dirname(CREDENTIALS_FILE), exist_ok=True)
-            with open(CREDENTIALS_FILE, 'w') as f:
-                json.dump({
-                    'username': username,
-                    'password': password,
-                    'remember': True
-                }, f)
+            if not _cred_dir_ready:
+                os.makedirs(_CRED_DIR, exist_ok=True)
+                _cred_dir_ready = True
+            with open(CREDENTIALS_FILE, 'wb', buffering=0) as f:
+                f.write(_dumps(data))
+            # Update the cache in place so the next form open skips the disk read
+            LoginView._cred_cache = data
+            LoginView._cred_mtime = os.stat(CREDENTIALS_FILE).st_mtime_ns
+            _has_saved_creds = True
         except Exception as e:
             print(f"Could not save credentials: {e}")
-    
+
     def clear_saved_credentials(self):
         """Clear saved credentials"""
+        global _has_saved_creds
+        if not _has_saved_creds:
+            return
         try:
-            if os.path.exists(CREDENTIALS_FILE):
+            # Just remove and swallow the miss - one syscall instead of
+            # an exists() stat followed by the unlink
+            try:
                 os.remove(CREDENTIALS_FILE)
+            except FileNotFoundError:
+                pass
+            LoginView._cred_cache = None
+            LoginView._cred_mtime = 0
+            _has_saved_creds = False
         except Exception as e:
             print(f"Could not clear credentials: {e}")
     
     def create_widgets(self):
         """Create login/register widgets"""
         self.pack(fill=tk.BOTH, expand=True)
-        
-        # Left panel - Branding with gradient effect
-        left_panel = tk.Frame(self, bg=COLORS['primary'], width=500)
-        left_panel.pack(side=tk.LEFT, fill=tk.Y)
-        left_panel.pack_propagate(False)
-        
+
+        # Left panel - branding, cached across instantiations since it
+        # is pure static decoration
+        left_panel = self._get_or_build_left_panel(self.parent)
+        left_panel.pack(in_=self, side=tk.LEFT, fill=tk.Y)
+
+        # Right panel - Form
+        right_panel = tk.Frame(self, bg=COLORS['bg_primary'])
+        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+
+        # GPS text in top right corner
+        gps_label = tk.Label(
+            right_panel,
+            text="GPS",
+            font=('Segoe UI', 24, 'bold'),
+            bg=COLORS['bg_primary'],
+            fg=COLORS['primary']
+        )
+        gps_label.place(relx=0.95, rely=0.05, anchor='ne')
+
+        # Form container with shadow effect
+        form_wrapper = tk.Frame(right_panel, bg=COLORS['bg_primary'])
+        form_wrapper.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+
+        self.form_container = tk.Frame(form_wrapper, bg=COLORS['bg_primary'])
+        self.form_container.pack(padx=40, pady=40)
+
+        # Create login form
+        self.create_login_form()
+
+    @classmethod
+    def detach_cached_panel(cls):
+        """
+        Unmap the cached branding panel and return it.
+
+        Called by the main app before it destroys the root's children
+        on login/logout, so the panel can be skipped and reused by the
+        next LoginView instead of being rebuilt.
+        """
+        panel = cls._left_panel
+        if panel is not None and panel.winfo_exists():
+            panel.pack_forget()
+            return panel
+        return None
+
+    @classmethod
+    def _get_or_build_left_panel(cls, parent):
+        """Get the branding panel, building it on first use"""
+        panel = cls._left_panel
+        if panel is not None and panel.winfo_exists():
+            return panel
+
+        # Parented to the root window (not the view); the main app
+        # detaches it before clearing the root (detach_cached_panel),
+        # which is what lets it survive login/logout round-trips
+        panel = tk.Frame(parent, bg=COLORS['primary'], width=500)
+        panel.pack_propagate(False)
+
         # Create gradient effect with multiple frames
-        gradient_colors = ['#667EEA', '#6B5CE7', '#7647E0', '#8040D8', '#764BA2']
-        for i, color in enumerate(gradient_colors):
-            stripe = tk.Frame(left_panel, bg=color, height=150)
+        for color in _GRADIENT_COLORS:
+            stripe = tk.Frame(panel, bg=color, height=150)
             stripe.pack(fill=tk.X)
-        
+
         # Branding overlay
-        brand_frame = tk.Frame(left_panel, bg=COLORS['primary'])
+        brand_frame = tk.Frame(panel, bg=_GRAD_MID)
         brand_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        brand_frame.configure(bg=gradient_colors[2])
-        
+
         # Animated logo effect
-        logo_container = tk.Frame(brand_frame, bg=gradient_colors[2])
+        logo_container = tk.Frame(brand_frame, bg=_GRAD_MID)
         logo_container.pack(pady=(0, 20))
-        
+
         # Logo (without shadow - Tkinter doesn't support RGBA)
         logo_label = tk.Label(
             logo_container,
             text="💰",
             font=('Segoe UI', 80),
-            bg=gradient_colors[2],
-            fg=COLORS['text_white']
+            **_WHITE_ON_GRAD
         )
         logo_label.pack()
-        
+
         # App name with glow
         app_name = tk.Label(
             brand_frame,
             text="Expense Tracker",
             font=FONTS['heading_xl'],
-            bg=gradient_colors[2],
-            fg=COLORS['text_white']
+            **_WHITE_ON_GRAD
         )
         app_name.pack()
-        
+
         # Tagline
         tagline = tk.Label(
             brand_frame,
             text="Smart Money Management",
             font=FONTS['body_large'],
-            bg=gradient_colors[2],
-            fg='#E2E8F0'
+            **_MUTED_ON_GRAD
         )
         tagline.pack(pady=(5, 0))
-        
+
         # Feature cards
-        features_frame = tk.Frame(brand_frame, bg=gradient_colors[2])
+        features_frame = tk.Frame(brand_frame, bg=_GRAD_MID)
         features_frame.pack(pady=(40, 0))
-        
-        features = [
-            ("📊", "Track Expenses", "Monitor daily spending"),
-            ("🎯", "Set Budgets", "Control your finances"),
-            ("📈", "Visual Reports", "Charts & analytics"),
-            ("💾", "Export Data", "Download reports"),
-        ]
-        
-        for icon, title, desc in features:
-            feat_card = tk.Frame(features_frame, bg=gradient_colors[2], padx=15, pady=10)
+
+        for icon, title, desc in cls._FEATURES:
+            feat_card = tk.Frame(features_frame, bg=_GRAD_MID, padx=15, pady=10)
             feat_card.pack(fill=tk.X, pady=5)
-            
+
             tk.Label(
                 feat_card,
                 text=f"{icon}  {title}",
                 font=FONTS['body_medium'],
-                bg=gradient_colors[2],
-                fg=COLORS['text_white']
+                **_WHITE_ON_GRAD
             ).pack(anchor='w')
-            
+
             tk.Label(
                 feat_card,
                 text=desc,
                 font=FONTS['caption'],
-                bg=gradient_colors[2],
-                fg='#E2E8F0'
+                **_MUTED_ON_GRAD
             ).pack(anchor='w')
-        
-        # Right panel - Form
-        right_panel = tk.Frame(self, bg=COLORS['bg_primary'])
-        right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        # GPS text in top right corner
-        gps_label = tk.Label(
-            right_panel,
-            text="GPS",
-            font=('Segoe UI', 24, 'bold'),
-            bg=COLORS['bg_primary'],
-            fg=COLORS['primary']
-        )
-        gps_label.place(relx=0.95, rely=0.05, anchor='ne')
-        
-        # Form container with shadow effect
-        form_wrapper = tk.Frame(right_panel, bg=COLORS['bg_primary'])
-        form_wrapper.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-        
-        self.form_container = tk.Frame(form_wrapper, bg=COLORS['bg_primary'])
-        self.form_container.pack(padx=40, pady=40)
-        
-        # Create login form
-        self.create_login_form()
-    
+
+        cls._left_panel = panel
+        return panel
+
     def create_login_form(self):
-        """Create enhanced login form"""
-        self.clear_form()
+        """Show the login form, building it on first use"""
+        if self._register_frame is not None:
+            self._register_frame.pack_forget()
         self.is_login_mode = True
-        
+        self._entries = self._login_entries
+
+        if self._login_frame is None:
+            self._login_frame = tk.Frame(self.form_container, bg=COLORS['bg_primary'])
+            self._build_login_form(self._login_frame)
+            # Load saved credentials once the entries exist - later
+            # toggles keep whatever the user already typed
+            self.load_saved_credentials()
+
+        self._login_frame.pack(fill=tk.BOTH)
+
+        # Bind Enter key
+        self.parent.bind('<Return>', lambda e: self.handle_login())
+
+    def _build_login_form(self, form):
+        """Create enhanced login form"""
         # Welcome icon
         icon_label = tk.Label(
-            self.form_container,
+            form,
             text="👋",
             font=('Segoe UI', 48),
             bg=COLORS['bg_primary']
@@ -204,31 +313,31 @@ class LoginView(tk.Frame):
         
         # Title
         title = tk.Label(
-            self.form_container,
+            form,
             text="Welcome Back!",
             font=FONTS['heading'],
             bg=COLORS['bg_primary'],
             fg=COLORS['text_primary']
         )
         title.pack(pady=(0, 5))
-        
+
         subtitle = tk.Label(
-            self.form_container,
+            form,
             text="Sign in to continue to your account",
             font=FONTS['body'],
             bg=COLORS['bg_primary'],
             fg=COLORS['text_secondary']
         )
         subtitle.pack(pady=(0, 30))
-        
+
         # Username field with icon
-        self.create_input_field("👤", "Username or Email", "username")
-        
+        self.create_input_field(form, "👤", "Username or Email", "username")
+
         # Password field with icon
-        self.create_input_field("🔒", "Password", "password", show='•')
-        
+        self.create_input_field(form, "🔒", "Password", "password", show='•')
+
         # Remember me & Forgot password row
-        options_frame = tk.Frame(self.form_container, bg=COLORS['bg_primary'])
+        options_frame = tk.Frame(form, bg=COLORS['bg_primary'])
         options_frame.pack(fill=tk.X, pady=(5, 20))
         
         # Remember me checkbox
@@ -250,7 +359,7 @@ class LoginView(tk.Frame):
         
         # Login button with hover effect
         login_btn = tk.Button(
-            self.form_container,
+            form,
             text="🚀  Sign In",
             font=FONTS['button_large'],
             bg=COLORS['primary'],
@@ -268,20 +377,24 @@ class LoginView(tk.Frame):
         # Hover effects
         login_btn.bind('<Enter>', lambda e: login_btn.config(bg=COLORS['primary_dark']))
         login_btn.bind('<Leave>', lambda e: login_btn.config(bg=COLORS['primary']))
-        
-        # Bind Enter key
-        self.parent.bind('<Return>', lambda e: self.handle_login())
-        
-        # Divider
-        divider_frame = tk.Frame(self.form_container, bg=COLORS['bg_primary'])
-        divider_frame.pack(fill=tk.X, pady=15)
-        
-        tk.Frame(divider_frame, bg=COLORS['border'], height=1).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        tk.Label(divider_frame, text="  OR  ", font=FONTS['caption'], bg=COLORS['bg_primary'], fg=COLORS['text_light']).pack(side=tk.LEFT)
-        tk.Frame(divider_frame, bg=COLORS['border'], height=1).pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        # Divider - one canvas instead of two frames plus a label
+        divider = tk.Canvas(form, height=14, highlightthickness=0, bg=COLORS['bg_primary'])
+        left_line = divider.create_line(0, 7, 0, 7, fill=COLORS['border'])
+        or_text = divider.create_text(0, 7, text='OR', fill=COLORS['text_light'], font=FONTS['caption'])
+        right_line = divider.create_line(0, 7, 0, 7, fill=COLORS['border'])
+
+        def layout_divider(event):
+            mid = event.width / 2
+            divider.coords(or_text, mid, 7)
+            divider.coords(left_line, 0, 7, mid - 24, 7)
+            divider.coords(right_line, mid + 24, 7, event.width, 7)
+
+        divider.bind('<Configure>', layout_divider)
+        divider.pack(fill=tk.X, pady=15)
         
         # Register link
-        register_frame = tk.Frame(self.form_container, bg=COLORS['bg_primary'])
+        register_frame = tk.Frame(form, bg=COLORS['bg_primary'])
         register_frame.pack(pady=(10, 0))
         
         tk.Label(
@@ -304,18 +417,28 @@ class LoginView(tk.Frame):
         register_link.bind('<Button-1>', lambda e: self.create_register_form())
         register_link.bind('<Enter>', lambda e: register_link.config(fg=COLORS['primary_dark']))
         register_link.bind('<Leave>', lambda e: register_link.config(fg=COLORS['primary']))
-        
-        # Load saved credentials after creating entries
-        self.load_saved_credentials()
-    
+
     def create_register_form(self):
-        """Create enhanced registration form"""
-        self.clear_form()
+        """Show the registration form, building it on first use"""
+        if self._login_frame is not None:
+            self._login_frame.pack_forget()
         self.is_login_mode = False
-        
+        self._entries = self._register_entries
+
+        if self._register_frame is None:
+            self._register_frame = tk.Frame(self.form_container, bg=COLORS['bg_primary'])
+            self._build_register_form(self._register_frame)
+
+        self._register_frame.pack(fill=tk.BOTH)
+
+        # Bind Enter key
+        self.parent.bind('<Return>', lambda e: self.handle_register())
+
+    def _build_register_form(self, form):
+        """Create enhanced registration form"""
         # Icon
         icon_label = tk.Label(
-            self.form_container,
+            form,
             text="🎉",
             font=('Segoe UI', 48),
             bg=COLORS['bg_primary']
@@ -324,40 +447,40 @@ class LoginView(tk.Frame):
         
         # Title
         title = tk.Label(
-            self.form_container,
+            form,
             text="Create Account",
             font=FONTS['heading'],
             bg=COLORS['bg_primary'],
             fg=COLORS['text_primary']
         )
         title.pack(pady=(0, 5))
-        
+
         subtitle = tk.Label(
-            self.form_container,
+            form,
             text="Start tracking your expenses today",
             font=FONTS['body'],
             bg=COLORS['bg_primary'],
             fg=COLORS['text_secondary']
         )
         subtitle.pack(pady=(0, 25))
-        
+
         # Full name
-        self.create_input_field("👤", "Full Name", "full_name")
-        
+        self.create_input_field(form, "👤", "Full Name", "full_name")
+
         # Username
-        self.create_input_field("📝", "Username", "username")
-        
+        self.create_input_field(form, "📝", "Username", "username")
+
         # Email
-        self.create_input_field("📧", "Email Address", "email")
-        
+        self.create_input_field(form, "📧", "Email Address", "email")
+
         # Password
-        self.create_input_field("🔒", "Password", "password", show='•')
-        
+        self.create_input_field(form, "🔒", "Password", "password", show='•')
+
         # Confirm Password
-        self.create_input_field("🔐", "Confirm Password", "confirm_password", show='•')
-        
+        self.create_input_field(form, "🔐", "Confirm Password", "confirm_password", show='•')
+
         # Terms checkbox
-        terms_frame = tk.Frame(self.form_container, bg=COLORS['bg_primary'])
+        terms_frame = tk.Frame(form, bg=COLORS['bg_primary'])
         terms_frame.pack(fill=tk.X, pady=(10, 15))
         
         self.terms_var = tk.BooleanVar(value=True)
@@ -376,7 +499,7 @@ class LoginView(tk.Frame):
         
         # Register button
         register_btn = tk.Button(
-            self.form_container,
+            form,
             text="🎯  Create Account",
             font=FONTS['button_large'],
             bg=COLORS['success'],
@@ -393,12 +516,9 @@ class LoginView(tk.Frame):
         
         register_btn.bind('<Enter>', lambda e: register_btn.config(bg='#38A169'))
         register_btn.bind('<Leave>', lambda e: register_btn.config(bg=COLORS['success']))
-        
-        # Bind Enter key
-        self.parent.bind('<Return>', lambda e: self.handle_register())
-        
+
         # Login link
-        login_frame = tk.Frame(self.form_container, bg=COLORS['bg_primary'])
+        login_frame = tk.Frame(form, bg=COLORS['bg_primary'])
         login_frame.pack(pady=(10, 0))
         
         tk.Label(
@@ -422,10 +542,10 @@ class LoginView(tk.Frame):
         login_link.bind('<Enter>', lambda e: login_link.config(fg=COLORS['primary_dark']))
         login_link.bind('<Leave>', lambda e: login_link.config(fg=COLORS['primary']))
     
-    def create_input_field(self, icon, placeholder, field_name, show=None):
+    def create_input_field(self, parent, icon, placeholder, field_name, show=None):
         """Create styled input field with icon"""
         # Container
-        field_frame = tk.Frame(self.form_container, bg=COLORS['bg_tertiary'], padx=15, pady=12)
+        field_frame = tk.Frame(parent, bg=COLORS['bg_tertiary'], padx=15, pady=12)
         field_frame.pack(fill=tk.X, pady=(0, 12))
         
         # Icon
@@ -456,46 +576,58 @@ class LoginView(tk.Frame):
         entry.insert(0, placeholder)
         entry.config(fg=COLORS['text_light'])
         
+        # Resolve the colors once per field - focus events fire often
+        # and each .config() call is its own Tcl round-trip
+        focus_bg = COLORS['primary_light']
+        idle_bg = COLORS['bg_tertiary']
+        text_fg = COLORS['text_primary']
+        light_fg = COLORS['text_light']
+
         def on_focus_in(e):
             if entry.get() == placeholder:
                 entry.delete(0, tk.END)
-                entry.config(fg=COLORS['text_primary'])
-                if show:
-                    entry.config(show=show)
-            field_frame.config(bg=COLORS['primary_light'])
-            icon_label.config(bg=COLORS['primary_light'])
-            entry.config(bg=COLORS['primary_light'])
-        
+                entry.configure(bg=focus_bg, fg=text_fg, show=show or '')
+            else:
+                entry.configure(bg=focus_bg)
+            field_frame.configure(bg=focus_bg)
+            icon_label.configure(bg=focus_bg)
+
         def on_focus_out(e):
             if not entry.get():
                 entry.insert(0, placeholder)
-                entry.config(fg=COLORS['text_light'], show='')
-            field_frame.config(bg=COLORS['bg_tertiary'])
-            icon_label.config(bg=COLORS['bg_tertiary'])
-            entry.config(bg=COLORS['bg_tertiary'])
+                entry.configure(bg=idle_bg, fg=light_fg, show='')
+            else:
+                entry.configure(bg=idle_bg)
+            field_frame.configure(bg=idle_bg)
+            icon_label.configure(bg=idle_bg)
         
         entry.bind('<FocusIn>', on_focus_in)
         entry.bind('<FocusOut>', on_focus_out)
-        
+
         # Store reference
-        setattr(self, f'{field_name}_entry', entry)
-    
+        self._entries[field_name] = entry
+
     def get_entry_value(self, entry):
         """Get entry value, ignoring placeholder"""
+        # Every entry comes from create_input_field, which always sets
+        # .placeholder - no need for a hasattr probe
         value = entry.get()
-        if hasattr(entry, 'placeholder') and value == entry.placeholder:
+        if value == entry.placeholder:
             return ''
         return value.strip()
-    
-    def clear_form(self):
-        """Clear form container"""
-        for widget in self.form_container.winfo_children():
-            widget.destroy()
-    
+
+    def _val(self, field_name):
+        """Get a named field's value, ignoring placeholder text"""
+        return self.get_entry_value(self._entries[field_name])
+
     def handle_login(self):
         """Handle login button click"""
-        username = self.get_entry_value(self.username_entry)
-        password = self.get_entry_value(self.password_entry)
+        # Only the error paths need messagebox - sys.modules makes the
+        # repeat imports free
+        from tkinter import messagebox
+
+        username = self._val('username')
+        password = self._val('password')
         
         if not username or not password:
             messagebox.showerror("Error", "Please enter username and password")
@@ -516,11 +648,13 @@ class LoginView(tk.Frame):
     
     def handle_register(self):
         """Handle register button click"""
-        full_name = self.get_entry_value(self.full_name_entry)
-        username = self.get_entry_value(self.username_entry)
-        email = self.get_entry_value(self.email_entry)
-        password = self.get_entry_value(self.password_entry)
-        confirm_password = self.get_entry_value(self.confirm_password_entry)
+        from tkinter import messagebox
+
+        full_name = self._val('full_name')
+        username = self._val('username')
+        email = self._val('email')
+        password = self._val('password')
+        confirm_password = self._val('confirm_password')
         
         if not self.terms_var.get():
             messagebox.showerror("Error", "Please accept the Terms & Conditions")
@@ -5,12 +5,8 @@ Advanced analytics with interactive charts, graphs, and export options
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import sys
-import os
 from datetime import datetime, timedelta
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.styles import COLORS, FONTS, CHART_COLORS
 from utils.helpers import format_currency, get_month_name, get_month_short_name
 from controllers.expense_controller import ExpenseController